@@ -7,9 +7,19 @@ Test suite for some base_service utilities
 
 from __future__ import annotations
 from dataclasses import dataclass
+from pathlib import Path
+import subprocess
+import sys
+import textwrap
 import pytest
 from udsoncan.base_service import (
+    BaseService,
+    BaseSubfunction,
+    EmptyServiceData,
+    NO_SUBFUNCTION,
     ServiceData,
+    TranscodeError,
+    _has_generated_init,
     uds_field,
 )
 
@@ -34,6 +44,30 @@ def test_service_data_sanity() -> None:
     assert SimpleServiceData.get_parameter_resolutions() == (1, 1)
 
 
+@dataclass(slots=True)
+class SlottedServiceData(ServiceData):
+    """
+    Same layout as SimpleServiceData, declared with slots
+    """
+
+    an_int: int = uds_field(42, "d")
+    a_float: float = uds_field(3.14, "f")
+
+
+def test_service_data_slots() -> None:
+    """
+    Slotted subclasses should not carry a per-instance __dict__
+    """
+    assert not hasattr(SlottedServiceData(), "__dict__")
+    assert not hasattr(
+        SlottedServiceData.unpack(SlottedServiceData().pack()), "__dict__"
+    )
+    unpacked = SlottedServiceData.unpack(SlottedServiceData(an_int=7).pack())
+    assert unpacked.an_int == 7
+    # plain dataclass subclasses keep working alongside slotted ones
+    assert hasattr(SimpleServiceData(), "__dict__")
+
+
 def test_service_data_get_parameters() -> None:
     """
     Verifies that parameter names are properly extracted for
@@ -54,6 +88,15 @@ def test_service_data_get_payload_fmt() -> None:
     SimpleServiceData._iter_payload_fmt() == (">df",)
 
 
+def test_service_data_get_struct() -> None:
+    """
+    Checks that the compiled struct matches the payload format
+    """
+    assert SimpleServiceData.get_struct().format == ">df"
+    assert SimpleServiceData.get_struct().size == 12
+    assert SimpleServiceData.get_struct() is SimpleServiceData.get_struct()
+
+
 def test_service_data_pack_no_raise() -> None:
     """
     Checks that packing does not raise any error
@@ -111,6 +154,20 @@ def test_get_subfunction_parameters(
     assert data_cls.get_parameter_names(1) == ("an_int", "a_float")
 
 
+@pytest.mark.parametrize("data_cls", [ScaledServiceData, AdvancedServiceData])
+def test_get_subfunction_parameter_values(
+    data_cls: type[ScaledServiceData] | type[AdvancedServiceData],
+) -> None:
+    """
+    Checks that parameter values are extracted for each subfunction,
+    including subfunctions with a single parameter
+    """
+    data = data_cls(an_int=7, a_float=0.5)
+    assert tuple(data.get_parameter_values()) == (7,)
+    assert tuple(data.get_parameter_values(1)) == (7, 0.5)
+    assert tuple(ServiceData().get_parameter_values()) == ()
+
+
 @pytest.mark.parametrize("data_cls", [ScaledServiceData, AdvancedServiceData])
 @pytest.mark.parametrize("subfunction,expects", [(0, ">d"), (1, ">df")])
 def test_payload_fmt_with_subfunctions(
@@ -124,6 +181,10 @@ def test_payload_fmt_with_subfunctions(
     """
     assert data_cls.get_payload_fmt(subfunction) == expects
     assert data_cls._iter_payload_fmt(subfunction) == (expects,)
+    # structs are interned across classes sharing the same format
+    assert data_cls.get_struct(subfunction) is AdvancedServiceData.get_struct(
+        subfunction
+    )
 
 
 @pytest.mark.parametrize(
@@ -173,6 +234,56 @@ def test_service_data_scaling(
         int_value,
         float_value * 10,
     )
+    assert type(base_data.get_parameter_values(1, scale=True)[0]) is int
+
+
+@dataclass
+class IntegerResolutionServiceData(ServiceData):
+    """
+    Uses an integer resolution, which keeps decoded values integers
+    """
+
+    an_int: int = uds_field(4, "H", resolution=2)
+
+
+def test_service_data_scaled_values_match_packed_values() -> None:
+    """
+    Scaled values of integer formats are rounded, as they are when packed
+    """
+    data = IntegerResolutionServiceData(an_int=5)
+    packed_values = data.get_struct().unpack(data.pack())
+    assert data.get_parameter_values(scale=True) == packed_values
+    assert data.get_parameter_items() == (("an_int", packed_values[0]),)
+    assert type(data.get_parameter_values(scale=True)[0]) is int
+
+
+@dataclass
+class UnitFloatResolutionServiceData(ServiceData):
+    """
+    Uses a float resolution of 1.0, which makes decoded values floats
+    """
+
+    an_int: float = uds_field(4, "H", resolution=1.0)
+
+
+def test_service_data_unscaled_values_are_untouched() -> None:
+    """
+    Parameters without resolution are not rescaled, so keep their exact type
+    """
+    data = SimpleServiceData(an_int=7, a_float=1 / 8)
+    assert data.get_parameter_values(scale=True) == data.get_parameter_values()
+    unpacked = MultiVariadicServiceData.unpack(MultiVariadicServiceData().pack())
+    assert type(unpacked.an_int) is int
+    unpacked_int = IntegerResolutionServiceData.unpack(
+        IntegerResolutionServiceData(an_int=6).pack()
+    )
+    assert unpacked_int.an_int == 6
+    assert type(unpacked_int.an_int) is int
+    unpacked_float = UnitFloatResolutionServiceData.unpack(
+        UnitFloatResolutionServiceData(an_int=6).pack()
+    )
+    assert unpacked_float.an_int == 6
+    assert type(unpacked_float.an_int) is float
 
 
 @pytest.mark.parametrize(
@@ -238,6 +349,13 @@ def test_service_data_variadic_payload_fmt() -> None:
     assert SimpleVariadicServiceData._iter_payload_fmt() == (">dh", ">{}sf")
 
 
+def test_service_data_variadic_struct() -> None:
+    """
+    For variadic payloads, the compiled struct only covers the leading static chunk
+    """
+    assert SimpleVariadicServiceData.get_struct().format == ">dh"
+
+
 def test_service_data_variadic_sanity() -> None:
     assert SimpleVariadicServiceData.has_variadic_fields() is True
     assert SimpleVariadicServiceData.get_variadic_fields_indexes() == (1,)
@@ -256,9 +374,347 @@ def test_service_data_variadic_length() -> None:
     assert packed[10:16] == test_data
 
 
+def test_service_data_variadic_length_changes() -> None:
+    """
+    Checks that packing successive payloads of different lengths
+    does not reuse a layout computed for a previous length
+    """
+    data = SimpleVariadicServiceData(a_float=1 / 8)
+    for length in (6, 2, 6, 0, 300):
+        data.some_bytes = bytes(i % 256 for i in range(length))
+        packed = data.pack()
+        assert len(packed) == 8 + 2 + length + 4
+        assert packed[8:10] == length.to_bytes(2, "big")
+        assert SimpleVariadicServiceData.unpack(packed) == data
+
+
 def test_service_data_pack_inverts_unpack_variadic() -> None:
     test_data = b"\x01\x02\x03\x04\x05\x06"
     data = SimpleVariadicServiceData(some_bytes=test_data)
     unpacked = SimpleVariadicServiceData.unpack(data.pack())
 
     assert data.some_bytes == unpacked.some_bytes
+
+
+@dataclass
+class AdvancedVariadicServiceData(ServiceData):
+    """
+    A service data class whose variadic field only applies to a subfunction
+    """
+
+    an_int: int = uds_field(42, "d")
+    some_bytes: bytes = uds_field(b"", "h{}s", subfunctions=1)
+    a_float: float = uds_field(3.14, "f", subfunctions=1)
+
+
+@pytest.mark.parametrize("subfunction", [0, 1])
+def test_service_data_pack_inverts_unpack_variadic_subfunction(
+    subfunction: int,
+) -> None:
+    """
+    Checks that the payload format of the packed subfunction is used
+    for variadic fields, rather than the default one
+    """
+    data = AdvancedVariadicServiceData(
+        subfunction=subfunction, some_bytes=b"\x01\x02\x03", a_float=1 / 8
+    )
+    unpacked = AdvancedVariadicServiceData.unpack(data.pack(), subfunction=subfunction)
+    assert tuple(unpacked.get_parameter_items(subfunction)) == tuple(
+        data.get_parameter_items(subfunction)
+    )
+
+
+@pytest.mark.parametrize("subfunction,indexes", [(0, ()), (1, (1,)), (2, ())])
+def test_service_data_variadic_indexes_subfunction(
+    subfunction: int, indexes: tuple[int, ...]
+) -> None:
+    assert AdvancedVariadicServiceData.get_variadic_fields_indexes(subfunction) == indexes
+    assert AdvancedVariadicServiceData.has_variadic_fields(subfunction) is bool(indexes)
+
+
+@dataclass
+class MultiVariadicServiceData(ServiceData):
+    """
+    A service data class with consecutive variadic fields
+    """
+
+    an_int: int = uds_field(42, "B")
+    first_bytes: bytes = uds_field(b"", "h{}s")
+    second_bytes: bytes = uds_field(b"", "B{}s")
+    a_float: float = uds_field(3.14, "f", resolution=0.5)
+
+
+def test_service_data_pack_inverts_unpack_multi_variadic() -> None:
+    data = MultiVariadicServiceData(
+        first_bytes=b"\x01\x02", second_bytes=b"\x03\x04\x05", a_float=1.5
+    )
+    packed = data.pack()
+    assert packed[:5] == b"\x2a\x00\x02\x01\x02"
+    assert packed[5:9] == b"\x03\x03\x04\x05"
+    assert MultiVariadicServiceData.unpack(packed) == data
+
+
+@pytest.mark.parametrize("delta", [-1, 1])
+def test_service_data_unpack_variadic_wrong_length(delta: int) -> None:
+    """
+    Checks that payloads that do not match the announced lengths are rejected
+    """
+    packed = MultiVariadicServiceData(first_bytes=b"\x01\x02").pack()
+    data = packed[:delta] if delta < 0 else packed + b"\x00" * delta
+    with pytest.raises(TranscodeError):
+        MultiVariadicServiceData.unpack(data)
+
+
+def test_service_data_pack_many_inverts_unpack_many() -> None:
+    instances = [
+        ScaledServiceData(subfunction=1, an_int=i, a_float=i / 8) for i in range(5)
+    ]
+    packed = ScaledServiceData.pack_many(instances)
+    assert packed == b"".join(data.pack() for data in instances)
+    assert ScaledServiceData.unpack_many(packed, subfunction=1) == instances
+    assert ScaledServiceData.unpack_many(b"", subfunction=1) == []
+
+
+def test_service_data_pack_many_rejects_other_classes() -> None:
+    with pytest.raises(ValueError):
+        SimpleServiceData.pack_many([SimpleServiceData(), ScaledServiceData()])
+
+
+def test_service_data_unpack_many_matches_unpack() -> None:
+    packed = SimpleServiceData.pack_many([SimpleServiceData()] * 3)
+    size = SimpleServiceData.get_struct().size
+    assert SimpleServiceData.unpack_many(packed) == [
+        SimpleServiceData.unpack(packed[offset : offset + size])
+        for offset in range(0, len(packed), size)
+    ]
+
+
+def test_service_data_unpack_many_errors() -> None:
+    packed = SimpleServiceData.pack_many([SimpleServiceData()] * 2)
+    with pytest.raises(TranscodeError):
+        SimpleServiceData.unpack_many(packed[:-1])
+    with pytest.raises(ValueError):
+        SimpleVariadicServiceData.unpack_many(SimpleVariadicServiceData().pack())
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        SimpleServiceData(an_int=-17, a_float=1 / 8),
+        ScaledServiceData(subfunction=1, an_int=3, a_float=1 / 8),
+        SimpleVariadicServiceData(some_bytes=b"\x01\x02\x03"),
+        MultiVariadicServiceData(first_bytes=b"\x01", second_bytes=b"\x02\x03"),
+    ],
+)
+def test_service_data_pack_into(data: ServiceData) -> None:
+    """
+    Checks that pack_into writes the same payload as pack at the given offset
+    """
+    packed = data.pack()
+    assert data.packed_size() == len(packed)
+    buffer = bytearray(len(packed) + 3)
+    assert data.pack_into(buffer, 2) == len(packed)
+    assert buffer == b"\x00\x00" + packed + b"\x00"
+    with pytest.raises(TranscodeError):
+        data.pack_into(bytearray(len(packed) - 1))
+
+
+@dataclass
+class PostInitServiceData(ServiceData):
+    """
+    Customizes __post_init__, which unpack should still call
+    """
+
+    an_int: int = uds_field(42, "d")
+    doubled: int = 0
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.doubled = self.an_int * 2
+
+
+@dataclass(init=False)
+class CustomInitServiceData(ServiceData):
+    """
+    Hand-writes __init__, which unpack should still call
+    """
+
+    an_int: int = uds_field(42, "H")
+    doubled: int = 0
+
+    def __init__(self, subfunction: int = NO_SUBFUNCTION, an_int: int = 0) -> None:
+        self.subfunction = subfunction
+        self.an_int = an_int
+        self.doubled = an_int * 2
+        self.__post_init__()
+
+
+@dataclass
+class ExecInitServiceData(ServiceData):
+    """
+    Defines __init__ from generated source, which @dataclass keeps
+    and unpack should still call
+    """
+
+    an_int: int = uds_field(42, "H")
+    doubled: int = 0
+
+    exec(
+        "def __init__(self, subfunction=0, an_int=0):\n"
+        "    self.subfunction = subfunction\n"
+        "    self.an_int = an_int\n"
+        "    self.doubled = an_int * 2\n"
+    )
+
+
+@dataclass(slots=True)
+class SlottedCustomInitServiceData(ServiceData):
+    """
+    Hand-writes __init__ in a class that @dataclass(slots=True) re-creates
+    """
+
+    an_int: int = uds_field(42, "H")
+    doubled: int = 0
+
+    def __init__(self, subfunction: int = NO_SUBFUNCTION, an_int: int = 0) -> None:
+        self.subfunction = subfunction
+        self.an_int = an_int
+        self.doubled = an_int * 2
+
+
+def test_service_data_unpack_sets_defaults() -> None:
+    """
+    Checks that unpacked instances are equivalent to constructed ones,
+    including for the fields the payload does not provide
+    """
+    data = AdvancedServiceData(subfunction=0, an_int=7)
+    unpacked = AdvancedServiceData.unpack(data.pack(), subfunction=0)
+    assert unpacked == data
+    assert unpacked.a_float == 3.14
+    assert PostInitServiceData.unpack(PostInitServiceData(an_int=7).pack()).doubled == 14
+    assert CustomInitServiceData.unpack(CustomInitServiceData(an_int=5).pack()).doubled == 10
+    for data_cls in (ExecInitServiceData, SlottedCustomInitServiceData):
+        assert data_cls.unpack(data_cls(an_int=5).pack()).doubled == 10
+    # generated __init__ are still skipped, including in re-created slotted classes
+    assert _has_generated_init(SlottedServiceData)
+    assert _has_generated_init(PostInitServiceData)
+
+
+class CustomService(BaseService):
+    """
+    A non-standard service, registered on definition
+    """
+
+    _sid = 0xBA
+
+
+def test_service_from_id() -> None:
+    from udsoncan.services import DiagnosticSessionControl
+
+    assert BaseService.from_request_id(0x10) is DiagnosticSessionControl
+    assert BaseService.from_response_id(0x50) is DiagnosticSessionControl
+    assert BaseService.from_request_id(0xBA) is CustomService
+    assert BaseService.from_response_id(0xFA) is CustomService
+    assert BaseService.from_request_id(0xBB) is None
+    # lookups only consider subclasses of the class they are performed on
+    assert DiagnosticSessionControl.from_request_id(0xBA) is None
+
+
+def test_service_from_id_in_custom_hierarchies() -> None:
+    """
+    Classes sharing the ID of a standard service remain reachable
+    from the classes they derive from
+    """
+    from udsoncan.services import DiagnosticSessionControl
+
+    class CustomSessionControl(DiagnosticSessionControl):
+        pass
+
+    class CustomBase(BaseService):
+        pass
+
+    class SessionControlOverride(CustomBase):
+        _sid = 0x10
+
+    assert DiagnosticSessionControl.from_request_id(0x10) is CustomSessionControl
+    assert CustomBase.from_request_id(0x10) is SessionControlOverride
+    assert CustomBase.from_response_id(0x50) is SessionControlOverride
+    # the standard service comes first for lookups on BaseService
+    assert BaseService.from_request_id(0x10) is DiagnosticSessionControl
+
+
+def test_standard_services_take_precedence_over_earlier_definitions() -> None:
+    """
+    Standard services are imported lazily, so a custom service may be defined
+    before the standard service sharing its ID, which should still be found first.
+    Run in a separate interpreter, for the standard services not to be imported yet
+    """
+    code = textwrap.dedent(
+        """
+        import sys
+        from udsoncan.base_service import BaseService
+
+        assert "udsoncan.services.read_data_by_periodic_identifier" not in sys.modules
+
+        class SharedIdService(BaseService):
+            _sid = 0x2A
+
+        class OwnIdService(BaseService):
+            _sid = 0xBC
+
+        from udsoncan.services import ReadDataByPeriodicIdentifier
+
+        assert BaseService.from_request_id(0x2A) is ReadDataByPeriodicIdentifier
+        assert BaseService.from_request_id(0xBC) is OwnIdService
+        """
+    )
+    subprocess.run(
+        [sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[1]
+    )
+
+
+class CustomSubfunction(BaseSubfunction):
+    __pretty_name__ = "custom subfunction"
+
+    first = 1
+    same_as_first = 1
+    specific = (0x40, 0x5F)
+    other_specific = (0x60, 0x7E)
+
+
+def test_subfunction_get_name() -> None:
+    assert CustomSubfunction.get_name(1) == "first"
+    assert CustomSubfunction.get_name(0x45) == "specific"
+    assert CustomSubfunction.get_name(0x7E) == "other_specific"
+    assert CustomSubfunction.get_name(0x10) == "Custom custom subfunction"
+
+
+def test_service_data_eq() -> None:
+    assert EmptyServiceData() == EmptyServiceData()
+    assert EmptyServiceData(subfunction=1) != EmptyServiceData(subfunction=2)
+    assert EmptyServiceData() != SimpleServiceData()
+
+
+def test_service_supported_negative_response() -> None:
+    from udsoncan.response_code import ResponseCode
+    from udsoncan.services import DiagnosticSessionControl
+
+    assert isinstance(DiagnosticSessionControl.supported_negative_response, frozenset)
+    assert all(
+        type(code) is int for code in DiagnosticSessionControl.supported_negative_response
+    )
+    assert DiagnosticSessionControl.is_supported_negative_response(
+        ResponseCode.SubFunctionNotSupported
+    )
+    assert DiagnosticSessionControl.is_supported_negative_response(
+        ResponseCode.GeneralReject
+    )
+    assert DiagnosticSessionControl._accepted_negative_response == (
+        DiagnosticSessionControl.supported_negative_response
+        | DiagnosticSessionControl.always_valid_negative_response
+    )
+    # allowed through ConditionsNotCorrect
+    assert DiagnosticSessionControl.is_supported_negative_response(0x90)
+    assert not DiagnosticSessionControl.is_supported_negative_response(
+        ResponseCode.RequestOutOfRange
+    )
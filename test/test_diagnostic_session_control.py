@@ -0,0 +1,90 @@
+"""
+Test suite for the DiagnosticSessionControl service data
+
+@date: 15.10.2026
+"""
+
+from __future__ import annotations
+import pytest
+from udsoncan.services.diagnostic_session_control import (
+    ResponseDataPost2006,
+    ResponseDataPre2006,
+)
+
+
+def test_response_data_structs() -> None:
+    """
+    Response payloads are decoded through the compiled structs of the data classes
+    """
+    assert ResponseDataPost2006.get_struct().format == ">HH"
+    assert ResponseDataPre2006.get_struct().format == ">2s"
+
+
+def test_payload_fmt() -> None:
+    """
+    payload_fmt is kept for backward compatibility
+    """
+    from udsoncan.services import DiagnosticSessionControl
+
+    assert DiagnosticSessionControl.payload_fmt == ">HH"
+
+
+def test_response_data_post_2006_unpack() -> None:
+    data = ResponseDataPost2006.unpack(b"\x00\x32\x01\xf4")
+    assert data.p2_server_max == pytest.approx(0.05)
+    assert data.p2_star_server_max == pytest.approx(5.0)
+
+
+def test_response_data_pre_2006_round_trip() -> None:
+    data = ResponseDataPre2006(session_param_records=b"\x12\x34")
+    assert ResponseDataPre2006.unpack(data.pack()) == data
+
+
+def test_response_data_post_2006_round_trip() -> None:
+    """
+    Timings are rounded to the closest integer count of their resolution
+    """
+    data = ResponseDataPost2006(p2_server_max=0.05, p2_star_server_max=5.0)
+    assert data.pack() == b"\x00\x32\x01\xf4"
+    unpacked = ResponseDataPost2006.unpack(data.pack())
+    assert unpacked.p2_server_max == pytest.approx(0.05)
+    assert unpacked.p2_star_server_max == pytest.approx(5.0)
+
+
+def test_get_response_cls() -> None:
+    from udsoncan.services import DiagnosticSessionControl
+    from udsoncan.standards import StandardVersion
+
+    for _ in range(2):
+        assert (
+            DiagnosticSessionControl.get_response_cls(StandardVersion.UDS_2006)
+            is ResponseDataPre2006
+        )
+        assert (
+            DiagnosticSessionControl.get_response_cls(StandardVersion.UDS_2013)
+            is ResponseDataPost2006
+        )
+
+
+@pytest.mark.parametrize("data_cls", [ResponseDataPost2006, ResponseDataPre2006])
+def test_response_data_slots(data_cls: type) -> None:
+    assert not hasattr(data_cls(), "__dict__")
+
+
+@pytest.mark.parametrize("session", [-1, 0x80, 1.0])
+def test_make_request_invalid_session(session: int) -> None:
+    from udsoncan.services import DiagnosticSessionControl
+
+    with pytest.raises(ValueError):
+        DiagnosticSessionControl.make_request(session)
+
+
+def test_make_request_returns_independent_requests() -> None:
+    from udsoncan.services import DiagnosticSessionControl
+
+    request = DiagnosticSessionControl.make_request(1)
+    assert request.get_payload() == b"\x10\x01"
+    request.suppress_positive_response = True
+    other = DiagnosticSessionControl.make_request(1)
+    assert other is not request
+    assert other.get_payload() == b"\x10\x01"
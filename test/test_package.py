@@ -0,0 +1,26 @@
+"""
+Test suite for the lazily imported exports of the udsoncan package
+
+@date: 15.10.2026
+"""
+
+from __future__ import annotations
+import udsoncan
+
+
+def test_all_matches_lazy_exports() -> None:
+    """
+    __all__ is spelled out for static analysis, it should not drift
+    from the names actually exported
+    """
+    assert len(udsoncan.__all__) == len(set(udsoncan.__all__))
+    assert set(udsoncan.__all__) == {
+        "latest_standard",
+        "setup_logging",
+        *udsoncan._LAZY_EXPORTS,
+    }
+
+
+def test_all_names_resolve() -> None:
+    for name in udsoncan.__all__:
+        assert getattr(udsoncan, name) is not None
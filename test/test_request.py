@@ -111,3 +111,11 @@ class TestRequest(UdsTest):
     def test_spr_with_no_subfunction(self):
         with self.assertRaises(ValueError):
             Request(service=DummyServiceNoSubunction, suppress_positive_response=True)
+
+    def test_copy(self):
+        req = Request(DummyServiceNormal, subfunction=0x44, data=b"\x12")
+        req2 = req.copy()
+        self.assertIsNot(req, req2)
+        self.assertEqual(req.get_payload(), req2.get_payload())
+        req2.suppress_positive_response = True
+        self.assertFalse(req.suppress_positive_response)
@@ -1,13 +1,16 @@
 import logging
-import logging.config
 from os import path
+from typing import TYPE_CHECKING
 
-from udsoncan.exceptions import *
-from udsoncan.response import Response
-from udsoncan.request import Request
+from udsoncan._lazy import lazy_module
 
-from udsoncan.common import *
-from udsoncan.typing import *
+if TYPE_CHECKING:
+    from udsoncan.exceptions import *
+    from udsoncan.response import Response
+    from udsoncan.request import Request
+
+    from udsoncan.common import *
+    from udsoncan.typing import *
 
 __version__ = "1.23.1"
 __license__ = "MIT"
@@ -23,6 +26,10 @@ def setup_logging(config_file=__default_log_config_file):
     """
     This function setup the logger accordingly to the module provided cfg file
     """
+    # logging.config pulls logging.handlers and socketserver,
+    # only paying for them when logging is actually configured
+    import logging.config
+
     try:
         logging.config.fileConfig(config_file)
     except Exception as e:
@@ -30,3 +37,95 @@ def setup_logging(config_file=__default_log_config_file):
             "Cannot load logging configuration from %s. %s:%s"
             % (config_file, e.__class__.__name__, str(e))
         )
+
+
+# Public names re-exported from submodules, mapped to their module.
+# They are imported on first access (PEP 562), so that `import udsoncan`
+# does not pay for the submodules the caller does not use.
+_LAZY_EXPORTS: dict[str, str] = {
+    **dict.fromkeys(
+        (
+            "TimeoutException",
+            "NegativeResponseException",
+            "InvalidResponseException",
+            "UnexpectedResponseException",
+            "ConfigError",
+        ),
+        "exceptions",
+    ),
+    "Response": "response",
+    "Request": "request",
+    **dict.fromkeys(
+        (
+            "AddressAndLengthFormatIdentifier",
+            "Baudrate",
+            "CommunicationType",
+            "DataFormatIdentifier",
+            "Dtc",
+            "DataIdentifier",
+            "check_did_config",
+            "fetch_codec_definition_from_config",
+            "make_did_codec_from_definition",
+            "DidCodec",
+            "AsciiCodec",
+            "DynamicDidDefinition",
+            "Filesize",
+            "IOMasks",
+            "IOValues",
+            "MemoryLocation",
+            "Routine",
+            "Units",
+        ),
+        "common",
+    ),
+    **dict.fromkeys(
+        (
+            "ClientConfig",
+            "CodecDefinition",
+            "DIDConfig",
+            "IOConfig",
+            "IOConfigEntry",
+            "SecurityAlgoType",
+        ),
+        "typing",
+    ),
+}
+
+__all__ = [
+    "latest_standard",
+    "setup_logging",
+    "TimeoutException",
+    "NegativeResponseException",
+    "InvalidResponseException",
+    "UnexpectedResponseException",
+    "ConfigError",
+    "Response",
+    "Request",
+    "AddressAndLengthFormatIdentifier",
+    "Baudrate",
+    "CommunicationType",
+    "DataFormatIdentifier",
+    "Dtc",
+    "DataIdentifier",
+    "check_did_config",
+    "fetch_codec_definition_from_config",
+    "make_did_codec_from_definition",
+    "DidCodec",
+    "AsciiCodec",
+    "DynamicDidDefinition",
+    "Filesize",
+    "IOMasks",
+    "IOValues",
+    "MemoryLocation",
+    "Routine",
+    "Units",
+    "ClientConfig",
+    "CodecDefinition",
+    "DIDConfig",
+    "IOConfig",
+    "IOConfigEntry",
+    "SecurityAlgoType",
+]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_EXPORTS)
@@ -0,0 +1,50 @@
+"""
+Shared implementation of the lazily importing packages (PEP 562)
+"""
+
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+from typing import Any, Callable
+
+
+def lazy_module(
+    name: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Parameters
+    ----------
+    name: str
+        Name of the package, i.e. its `__name__`
+
+    exports: dict[str, str]
+        Public names of the package, mapped to the name of the submodule
+        defining them, e.g. `dtc` for `<package>.dtc`
+
+    Returns
+    -------
+    tuple[Callable[[str], Any], Callable[[], list[str]]]
+        The module level `__getattr__` and `__dir__` of the package,
+        importing the exported names on first access
+    """
+
+    def __getattr__(attribute: str) -> Any:
+        module_name = exports.get(attribute)
+        if module_name is not None:
+            value = getattr(import_module(f"{name}.{module_name}"), attribute)
+            # caching, next accesses will not go through this function
+            setattr(sys.modules[name], attribute, value)
+            return value
+        # submodules used to be reachable as attributes without being imported
+        try:
+            return import_module(f"{name}.{attribute}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{name}.{attribute}":
+                raise
+        raise AttributeError(f"module {name!r} has no attribute {attribute!r}")
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[name]), *exports})
+
+    return __getattr__, __dir__
@@ -9,6 +9,8 @@ from typing import (
     Optional,
     Union,
     Iterator,
+    Callable,
+    Collection,
     TypeVar,
     cast,
     Any,
@@ -20,8 +22,10 @@ from typing import (
 import inspect
 import struct
 from abc import ABC
-from dataclasses import dataclass, Field, field, fields
+from dataclasses import MISSING, dataclass, Field, field, fields
 from functools import cache
+from itertools import starmap
+from operator import attrgetter
 
 from .standards import StandardVersion
 from .response_code import ResponseCode
@@ -41,6 +45,7 @@ _FIELD_DEFAULTS: Final[dict[str, Any]] = {
 # --- Type aliasing --- #
 UdsPayloadTypes = Union[int, float, bytes, str]
 T = TypeVar("T", bound=UdsPayloadTypes)
+V = TypeVar("V")
 
 # ---Errors --- #
 # aliasing struct.error to get a more compelling error name
@@ -80,8 +85,10 @@ class UdsField(Field):
         resolution: int | float = 1,
         **kwargs,
     ) -> None:
-        self.subfunctions: set[int] = (
-            set((subfunctions,)) if isinstance(subfunctions, int) else set(subfunctions)
+        self.subfunctions: frozenset[int] = (
+            frozenset((subfunctions,))
+            if isinstance(subfunctions, int)
+            else frozenset(subfunctions)
         )
         self.fmt = fmt
         self.resolution = resolution
@@ -121,7 +128,7 @@ def uds_field(
 
     Example
     -------
-    @dataclass
+    @dataclass(slots=True)
     class AdvancedServiceData(ServiceData):
         an_int: int = uds_field(42, "d")
         a_float: float = uds_field(3.14, "f", subfunctions=1)
@@ -141,16 +148,206 @@ def uds_field(
     return cast(T, UdsField(subfunctions=subfunctions, fmt=fmt, **kwargs))
 
 
-@dataclass
-class ServiceData:
+@dataclass(frozen=True, eq=False)
+class _FieldTable:
+    """
+    Column-wise description of the UdsField declared by a ServiceData class.
+    Each attribute is a vector holding one entry per field, in declaration order,
+    so that per-subfunction views can be derived without walking the
+    dataclass fields again.
+    """
+
+    fields: tuple[UdsField, ...]
+    names: tuple[str, ...]
+    fmts: tuple[str, ...]
+    resolutions: tuple[float, ...]
+    scale_factors: tuple[float, ...]
+    subfunctions: tuple[frozenset[int], ...]
+    variadic_mask: tuple[bool, ...]
+    # positions of the fields relevant to each subfunction mentioned by a field
+    subfunction_indexes: dict[int, tuple[int, ...]]
+    # positions of the fields relevant to any other subfunction
+    common_indexes: tuple[int, ...]
+    # positions of the variadic fields among the parameters of each subfunction
+    # mentioned by a field, and among the parameters of any other subfunction
+    subfunction_variadic_indexes: dict[int, tuple[int, ...]]
+    common_variadic_indexes: tuple[int, ...]
+
+    @classmethod
+    def from_fields(cls, uds_fields: Iterable[UdsField]) -> _FieldTable:
+        """
+        Builds the table from a series of UdsField
+        """
+        uds_fields = tuple(uds_fields)
+        subfunctions = tuple(f.subfunctions for f in uds_fields)
+        known_subfunctions = frozenset().union(*subfunctions)
+        variadic_mask = tuple(f.has_variable_length for f in uds_fields)
+        subfunction_indexes = {
+            subfunction: tuple(
+                i
+                for i, supported in enumerate(subfunctions)
+                if not supported or subfunction in supported
+            )
+            for subfunction in known_subfunctions
+        }
+        common_indexes = tuple(
+            i for i, supported in enumerate(subfunctions) if not supported
+        )
+
+        def variadic_positions(indexes: tuple[int, ...]) -> tuple[int, ...]:
+            return tuple(
+                position
+                for position, index in enumerate(indexes)
+                if variadic_mask[index]
+            )
+
+        return cls(
+            fields=uds_fields,
+            names=tuple(f.name for f in uds_fields),
+            fmts=tuple(f.fmt for f in uds_fields),
+            resolutions=tuple(f.resolution for f in uds_fields),
+            scale_factors=tuple(f.scale_factor for f in uds_fields),
+            subfunctions=subfunctions,
+            variadic_mask=variadic_mask,
+            subfunction_indexes=subfunction_indexes,
+            common_indexes=common_indexes,
+            subfunction_variadic_indexes={
+                subfunction: variadic_positions(indexes)
+                for subfunction, indexes in subfunction_indexes.items()
+            },
+            common_variadic_indexes=variadic_positions(common_indexes),
+        )
+
+    def get_indexes(self, subfunction: int) -> tuple[int, ...]:
+        """
+        Returns
+        -------
+        tuple[int, ...]
+            Positions of the fields relevant to the given subfunction
+        """
+        return self.subfunction_indexes.get(subfunction, self.common_indexes)
+
+    def get_variadic_indexes(self, subfunction: int) -> tuple[int, ...]:
+        """
+        Returns
+        -------
+        tuple[int, ...]
+            Positions of the variadic fields among the parameters
+            of the given subfunction
+        """
+        return self.subfunction_variadic_indexes.get(
+            subfunction, self.common_variadic_indexes
+        )
+
+    def select(self, column: tuple[V, ...], subfunction: int) -> tuple[V, ...]:
+        """
+        Returns
+        -------
+        tuple
+            The entries of `column` for the fields relevant to the given subfunction
+        """
+        return tuple(column[i] for i in self.get_indexes(subfunction))
+
+
+@dataclass(frozen=True)
+class _PayloadChunk:
+    """
+    A statically sized part of a payload.
+    When the chunk is followed by a variadic field, the length of that field
+    is the last value of the chunk and its content comes right after the chunk.
+    """
+
+    struct: struct.Struct
+    # positions of the parameters packed by the struct
+    indexes: tuple[int, ...]
+    # position of the variadic parameter following this chunk, if any
+    variadic_index: int | None
+
+
+# struct format characters encoding integers
+_INTEGER_FORMATS: Final = frozenset("bBhHiIlLqQnN")
+
+
+def _has_generated_init(cls: type[ServiceData]) -> bool:
+    """
+    Returns
+    -------
+    bool
+        Whether the `__init__` of the given dataclass is the one generated by
+        `dataclass`, rather than a hand-written one or none at all (`init=False`).
+    """
+    if not cls.__dataclass_params__.init:  # type: ignore[attr-defined]
+        return False
+    owner = next(klass for klass in cls.__mro__ if "__init__" in vars(klass))
+    return not vars(owner).get("_defines_init", False)
+
+
+@cache
+def _compile_struct(fmt: str) -> struct.Struct:
+    """
+    Returns
+    -------
+    struct.Struct
+        The compiled struct for the given format.
+        Structs are interned, so that layouts sharing a format share the same object.
     """
-    Base class for Request/Response data
+    return struct.Struct(fmt)
+
 
+def _compile_function(
+    name: str, parameters: Iterable[str], body: Iterable[str], namespace: dict[str, Any]
+) -> Callable[..., Any]:
+    """
+    Builds a function from generated source lines.
+    Free names in the body are resolved from `namespace`.
+    These names, as well as the `len` builtin, are bound as closure variables
+    of the generated function, which are faster to load than globals.
+    """
+    namespace = {"len": len, **namespace}
+    source = (
+        f"def _make({', '.join(namespace)}):\n"
+        f"    def {name}({', '.join(parameters)}):\n"
+        + "".join(f"        {line}\n" for line in body)
+        + f"    return {name}"
+    )
+    scope: dict[str, Any] = {}
+    exec(source, scope)
+    return scope["_make"](**namespace)
+
+
+@dataclass(slots=True)
+class ServiceData:
+    """
+    Base class for Request/Response data.
+    Declares `__slots__`, so that subclasses declared with `@dataclass(slots=True)`
+    do not carry a per-instance `__dict__`.
     """
 
     SupportedSubFunctions: ClassVar[type[IntEnum] | None] = None
+    # generated pack/unpack functions of this class, by subfunction
+    _pack_impl: ClassVar[dict[int, Callable[[ServiceData], bytes]]] = {}
+    _pack_into_impl: ClassVar[
+        dict[int, Callable[[ServiceData, bytearray | memoryview, int], int]]
+    ] = {}
+    _unpack_impl: ClassVar[dict[int, Callable[[bytes | None], ServiceData]]] = {}
+    # whether the body of the class defines __init__, see _has_generated_init
+    _defines_init: ClassVar[bool] = False
     subfunction: int = field(default=NO_SUBFUNCTION)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Note: zero-argument super() cannot be used here, as @dataclass(slots=True)
+        # replaces this class with a copy that the implicit __class__ cell ignores
+        super(ServiceData, cls).__init_subclass__(**kwargs)
+        # each class gets its own dispatch tables
+        cls._pack_impl = {}
+        cls._pack_into_impl = {}
+        cls._unpack_impl = {}
+        # This runs before @dataclass adds its __init__, so an __init__ found here
+        # is hand-written. The copy made by @dataclass(slots=True) keeps the flag
+        # of the original class, as its __init__ may be the generated one
+        if "__dataclass_fields__" not in vars(cls):
+            cls._defines_init = "__init__" in vars(cls)
+
     # maps each subfunction to the binary format that should be used by struct
     # to pack the data
     def __post_init__(self) -> None:
@@ -183,6 +380,18 @@ class ServiceData:
             docs[subfn.name] = subfn_dict
         return docs
 
+    @classmethod
+    @cache
+    def _get_field_table(cls) -> _FieldTable:
+        """
+        Returns
+        -------
+        _FieldTable
+            The column-wise description of all the UdsField of this class.
+            Built once per class, all other field helpers are derived from it.
+        """
+        return _FieldTable.from_fields(f for f in fields(cls) if isinstance(f, UdsField))
+
     @classmethod
     def _iter_parameter_fields(
         cls, subfunction: int = NO_SUBFUNCTION
@@ -193,10 +402,8 @@ class ServiceData:
         UdsField
             All the fields that are relevant to the given subfunction
         """
-        for f in fields(cls):
-            # print(type(f), f)
-            if isinstance(f, UdsField) and f.supports_subfonction(subfunction):
-                yield f
+        table = cls._get_field_table()
+        yield from table.select(table.fields, subfunction)
 
     @classmethod
     def _iter_parameter_names(cls, subfunction: int = NO_SUBFUNCTION) -> Iterator[str]:
@@ -206,8 +413,7 @@ class ServiceData:
         str
             Name of the parameters that should be included for the passed subfunction
         """
-        for f in cls._iter_parameter_fields(subfunction):
-            yield f.name
+        yield from cls.get_parameter_names(subfunction)
 
     @classmethod
     @cache
@@ -220,9 +426,8 @@ class ServiceData:
             Note that for services with dynamic data lengths, it requires format arguments
             for the lengths of the fields.
         """
-        return _ENDIANNESS + "".join(
-            f.fmt for f in cls._iter_parameter_fields(subfunction)
-        )
+        table = cls._get_field_table()
+        return _ENDIANNESS + "".join(table.select(table.fmts, subfunction))
 
     @classmethod
     @cache
@@ -238,7 +443,7 @@ class ServiceData:
             by formatting the next format string.
 
         """
-        joined_fmt = "".join(f.fmt for f in cls._iter_parameter_fields(subfunction))
+        joined_fmt = cls.get_payload_fmt(subfunction).removeprefix(_ENDIANNESS)
         static_chunks = joined_fmt.split("{}")
         if not static_chunks:
             return ()
@@ -247,6 +452,356 @@ class ServiceData:
             *(_ENDIANNESS + "{}" + chunk for chunk in static_chunks[1:]),
         )
 
+    @classmethod
+    @cache
+    def get_struct(cls, subfunction: int = NO_SUBFUNCTION) -> struct.Struct:
+        """
+        Returns
+        -------
+        struct.Struct
+            The compiled struct for the payload of the given subfunction.
+            For payloads with variadic fields, only covers the statically known
+            part preceding the first variadic field; the remaining chunks
+            depend on the lengths found in the data.
+        """
+        return cls._get_payload_chunks(subfunction)[0].struct
+
+    @classmethod
+    @cache
+    def _get_payload_chunks(
+        cls, subfunction: int = NO_SUBFUNCTION
+    ) -> tuple[_PayloadChunk, ...]:
+        """
+        Returns
+        -------
+        tuple[_PayloadChunk, ...]
+            The payload of the given subfunction split into statically sized chunks,
+            each one but the last being followed by a variadic field.
+            Variadic fields are expected to be formatted as `<length>{}s`.
+        """
+        table = cls._get_field_table()
+        chunks: list[_PayloadChunk] = []
+        fmt = _ENDIANNESS
+        indexes: list[int] = []
+        for i, field_fmt in enumerate(table.select(table.fmts, subfunction)):
+            if "{}" not in field_fmt:
+                fmt += field_fmt
+                indexes.append(i)
+                continue
+            length_fmt, _, content_fmt = field_fmt.partition("{}")
+            if content_fmt != "s":
+                raise ValueError(
+                    f"Unsupported variadic format {field_fmt!r} in {cls.__name__}, "
+                    "expected <length format>{}s"
+                )
+            chunks.append(
+                _PayloadChunk(_compile_struct(fmt + length_fmt), tuple(indexes), i)
+            )
+            fmt = _ENDIANNESS
+            indexes = []
+        chunks.append(_PayloadChunk(_compile_struct(fmt), tuple(indexes), None))
+        return tuple(chunks)
+
+    @classmethod
+    def _generate_value_reads(cls, subfunction: int = NO_SUBFUNCTION) -> list[str]:
+        """
+        Returns
+        -------
+        list[str]
+            Source lines reading the scaled value of each parameter of the given
+            subfunction from `self`, into variables named `v<parameter position>`
+        """
+        table = cls._get_field_table()
+        body = []
+        for i, (name, scale, fmt) in enumerate(
+            zip(
+                cls.get_parameter_names(subfunction),
+                cls.get_parameter_scaling_factors(subfunction),
+                table.select(table.fmts, subfunction),
+            )
+        ):
+            # scaling factors are folded into the source as literals,
+            # and omitted entirely for unscaled parameters.
+            # Only the int 1 is a no-op, multiplying by 1.0 converts to float
+            if type(scale) is int and scale == 1:
+                body.append(f"v{i} = self.{name}")
+            elif fmt[-1:] in _INTEGER_FORMATS:
+                # scaled values are floats, that integer formats do not accept
+                body.append(f"v{i} = round(self.{name} * {float(scale)!r})")
+            else:
+                body.append(f"v{i} = self.{name} * {float(scale)!r}")
+        return body
+
+    @classmethod
+    @cache
+    def _compiled_pack(
+        cls, subfunction: int = NO_SUBFUNCTION
+    ) -> Callable[[ServiceData], bytes]:
+        """
+        Returns
+        -------
+        Callable[[ServiceData], bytes]
+            A function packing instances of this class for the given subfunction.
+            It is generated from the payload layout, so that fields, scaling factors
+            and structs are resolved once instead of on every call.
+        """
+        namespace: dict[str, Any] = {}
+        body = cls._generate_value_reads(subfunction)
+        parts = []
+        for n, chunk in enumerate(cls._get_payload_chunks(subfunction)):
+            namespace[f"_pack_{n}"] = chunk.struct.pack
+            args = [f"v{i}" for i in chunk.indexes]
+            if chunk.variadic_index is not None:
+                args.append(f"len(v{chunk.variadic_index})")
+            if chunk.struct.size:
+                parts.append(f"_pack_{n}({', '.join(args)})")
+            if chunk.variadic_index is not None:
+                parts.append(f"v{chunk.variadic_index}")
+        if len(parts) > 3:
+            # a single join beats chained concatenations, which copy the
+            # intermediate results, from two variadic fields onwards
+            body.append(f"return b''.join(({', '.join(parts)}))")
+        else:
+            body.append("return " + (" + ".join(parts) if parts else 'b""'))
+        return _compile_function("pack", ("self",), body, namespace)
+
+    @classmethod
+    @cache
+    def _compiled_pack_into(
+        cls, subfunction: int = NO_SUBFUNCTION
+    ) -> Callable[[ServiceData, bytearray | memoryview, int], int]:
+        """
+        Returns
+        -------
+        Callable[[ServiceData, bytearray | memoryview, int], int]
+            A function writing the payload of instances of this class
+            into a buffer at the given offset, and returning the number of bytes
+            written. Generated like `_compiled_pack`.
+        """
+        namespace: dict[str, Any] = {"_TranscodeError": TranscodeError}
+        body = cls._generate_value_reads(subfunction)
+        chunks = cls._get_payload_chunks(subfunction)
+        static_size = cls._get_static_size(subfunction)
+        lengths = []
+        for chunk in chunks:
+            if chunk.variadic_index is not None:
+                j = chunk.variadic_index
+                body.append(f"n{j} = len(v{j})")
+                lengths.append(f"n{j}")
+        if lengths:
+            # unlike struct, slice assignment resizes bytearrays instead of failing
+            body.append(f"size = {' + '.join((str(static_size), *lengths))}")
+            body.append("if len(buffer) - offset < size:")
+            body.append(
+                "    raise _TranscodeError("
+                'f"pack_into requires a buffer of at least {size + offset} bytes")'
+            )
+        for n, chunk in enumerate(chunks):
+            namespace[f"_pack_into_{n}"] = chunk.struct.pack_into
+            args = ["buffer", "offset", *(f"v{i}" for i in chunk.indexes)]
+            if chunk.variadic_index is not None:
+                args.append(f"n{chunk.variadic_index}")
+            if chunk.struct.size:
+                body.append(f"_pack_into_{n}({', '.join(args)})")
+                body.append(f"offset += {chunk.struct.size}")
+            if chunk.variadic_index is not None:
+                j = chunk.variadic_index
+                body.append(f"buffer[offset:offset + n{j}] = v{j}")
+                body.append(f"offset += n{j}")
+        body.append("return size" if lengths else f"return {static_size}")
+        return _compile_function(
+            "pack_into", ("self", "buffer", "offset"), body, namespace
+        )
+
+    @classmethod
+    @cache
+    def _get_static_size(cls, subfunction: int = NO_SUBFUNCTION) -> int:
+        """
+        Returns
+        -------
+        int
+            The size of the payload for the given subfunction,
+            excluding the content of variadic fields.
+        """
+        return sum(chunk.struct.size for chunk in cls._get_payload_chunks(subfunction))
+
+    @classmethod
+    @cache
+    def _compiled_unpack(
+        cls, subfunction: int = NO_SUBFUNCTION
+    ) -> Callable[[bytes | None], Self]:
+        """
+        Returns
+        -------
+        Callable[[bytes | None], Self]
+            A function building an instance of this class from the payload
+            of the given subfunction. Like `_compiled_pack`, it is generated from
+            the payload layout, including the checks on the passed data.
+        """
+        namespace: dict[str, Any] = {
+            "cls": cls,
+            "_subfunction": subfunction,
+            "_TranscodeError": TranscodeError,
+        }
+        parameter_names = cls.get_parameter_names(subfunction)
+        if not parameter_names:
+            namespace["_unexpected_data"] = (
+                f"Binary data got passed to {cls.__name__} despite expecting no parameter "
+                f"expected by subfunction {subfunction}. "
+                "Consider checking the subfunction ID. \nData:"
+            )
+            body = [
+                "if data:",
+                '    raise ValueError(f"{_unexpected_data}{data}")',
+                "return cls()",
+            ]
+            return _compile_function("unpack", ("data",), body, namespace)
+
+        namespace["_missing_data"] = (
+            f"{cls.__name__} expects parameters {parameter_names} yet no data was passed"
+        )
+        body = ["if not data:", "    raise ValueError(_missing_data)"]
+        chunks = cls._get_payload_chunks(subfunction)
+        if chunks.__len__() == 1:
+            (chunk,) = chunks
+            namespace["_unpack_0"] = chunk.struct.unpack
+            targets = "".join(f"v{i}, " for i in chunk.indexes)
+            body.append(f"{targets}= _unpack_0(data)")
+        else:
+            # chunks are read in place with unpack_from rather than from slices.
+            # The offset is a literal up to the first variadic field
+            offset = "0"
+            for n, chunk in enumerate(chunks):
+                namespace[f"_unpack_from_{n}"] = chunk.struct.unpack_from
+                targets = "".join(f"v{i}, " for i in chunk.indexes)
+                if chunk.variadic_index is not None:
+                    targets += f"n{chunk.variadic_index}, "
+                size = chunk.struct.size
+                if size:
+                    unpack = f"_unpack_from_{n}(data, {offset})"
+                    body.append(f"{targets}= {unpack}" if targets else unpack)
+                    if offset.isdigit():
+                        offset = str(int(offset) + size)
+                    else:
+                        body.append(f"offset += {size}")
+                if chunk.variadic_index is not None:
+                    j = chunk.variadic_index
+                    if offset.isdigit():
+                        body.append(f"offset = {offset} + n{j}")
+                        body.append(f"v{j} = data[{offset}:offset]")
+                        offset = "offset"
+                    else:
+                        body.append(f"v{j} = data[offset:offset + n{j}]")
+                        body.append(f"offset += n{j}")
+            if offset.isdigit():
+                body.append(f"offset = {offset}")
+            body.append("if offset != len(data):")
+            body.append(
+                '    raise _TranscodeError(f"unpack requires a buffer of {offset} bytes")'
+            )
+
+        values = cls._generate_unpacked_values(subfunction)
+        body.extend(cls._generate_construction(subfunction, values, namespace))
+        return _compile_function("unpack", ("data",), body, namespace)
+
+    @classmethod
+    @cache
+    def _compiled_build(
+        cls, subfunction: int = NO_SUBFUNCTION
+    ) -> Callable[..., Self]:
+        """
+        Returns
+        -------
+        Callable[..., Self]
+            A function building an instance of this class from the raw values
+            of the parameters of the given subfunction, passed positionally
+            in payload order, e.g. as yielded by `struct.Struct.iter_unpack`.
+        """
+        namespace: dict[str, Any] = {"cls": cls, "_subfunction": subfunction}
+        values = cls._generate_unpacked_values(subfunction)
+        arguments = tuple(f"v{i}" for i in range(len(values)))
+        body = cls._generate_construction(subfunction, values, namespace)
+        return _compile_function("build", arguments, body, namespace)
+
+    @classmethod
+    def _generate_unpacked_values(
+        cls, subfunction: int = NO_SUBFUNCTION
+    ) -> dict[str, str]:
+        """
+        Returns
+        -------
+        dict[str, str]
+            For each parameter of the given subfunction, the expression of its
+            value computed from the raw unpacked variable `v<parameter position>`
+        """
+        values = {}
+        for i, (name, resolution) in enumerate(
+            zip(
+                cls.get_parameter_names(subfunction),
+                cls.get_parameter_resolutions(subfunction),
+            )
+        ):
+            # same as scaling factors in _generate_value_reads
+            if type(resolution) is int and resolution == 1:
+                values[name] = f"v{i}"
+            else:
+                values[name] = f"v{i} * {resolution!r}"
+        return values
+
+    @classmethod
+    def _generate_construction(
+        cls, subfunction: int, values: dict[str, str], namespace: dict[str, Any]
+    ) -> list[str]:
+        """
+        Returns
+        -------
+        list[str]
+            Source lines returning a new instance for the given subfunction,
+            with the fields in `values` set to the given expressions and the other
+            fields set to their defaults.
+            Unless a subclass customizes `__init__` or `__post_init__` or is frozen,
+            the instance is built by direct attribute assignment, skipping `__init__`.
+            The objects required by these lines are added to `namespace`.
+        """
+        kwargs = ", ".join(f"{name}={value}" for name, value in values.items())
+        constructor_call = [f"return cls(subfunction=_subfunction, {kwargs})"]
+        if (
+            cls.__dataclass_params__.frozen  # type: ignore[attr-defined]
+            or cls.__post_init__ is not ServiceData.__post_init__
+            or not _has_generated_init(cls)
+        ):
+            return constructor_call
+
+        if cls.SupportedSubFunctions is not None and not isinstance(
+            subfunction, cls.SupportedSubFunctions
+        ):
+            # conversion usually performed by __post_init__, done once here
+            try:
+                subfunction = cls.SupportedSubFunctions(subfunction)
+            except ValueError:
+                raise ValueError(
+                    f"Subfunction {subfunction} is not in {cls.SupportedSubFunctions}"
+                )
+        namespace["_new"] = object.__new__
+        namespace["_subfunction"] = subfunction
+        body = ["self = _new(cls)", "self.subfunction = _subfunction"]
+        for f in fields(cls):
+            if f.name == "subfunction":
+                continue
+            if f.name in values:
+                body.append(f"self.{f.name} = {values[f.name]}")
+            elif f.default is not MISSING:
+                namespace[f"_default_{f.name}"] = f.default
+                body.append(f"self.{f.name} = _default_{f.name}")
+            elif f.default_factory is not MISSING:
+                namespace[f"_factory_{f.name}"] = f.default_factory
+                body.append(f"self.{f.name} = _factory_{f.name}()")
+            else:
+                # required field that the payload does not provide
+                return constructor_call
+        body.append("return self")
+        return body
+
     @classmethod
     @cache
     def get_parameter_names(cls, subfunction: int = NO_SUBFUNCTION) -> tuple[str, ...]:
@@ -256,7 +811,8 @@ class ServiceData:
         tuple[str, ...]
             Name of the parameters that should be included for the passed subfunction
         """
-        return tuple(cls._iter_parameter_names(subfunction))
+        table = cls._get_field_table()
+        return table.select(table.names, subfunction)
 
     @classmethod
     @cache
@@ -269,12 +825,14 @@ class ServiceData:
         tuple[str, ...]
             Name of the parameters that should be included for the passed subfunction
         """
+        table = cls._get_field_table()
         return tuple(
-            (
-                f.name
-                for f in cls._iter_parameter_fields(subfunction)
-                if f.has_variable_length
+            name
+            for name, is_variadic in zip(
+                table.select(table.names, subfunction),
+                table.select(table.variadic_mask, subfunction),
             )
+            if is_variadic
         )
 
     @classmethod
@@ -289,7 +847,8 @@ class ServiceData:
             The resolutions to apply to parameters when decoding,
             as a vector.
         """
-        return tuple(f.resolution for f in cls._iter_parameter_fields(subfunction))
+        table = cls._get_field_table()
+        return table.select(table.resolutions, subfunction)
 
     @classmethod
     @cache
@@ -303,64 +862,111 @@ class ServiceData:
             The scaling factors to apply to parameters when encoding,
             basically the inverse of resolution
         """
-        return tuple(f.scale_factor for f in cls._iter_parameter_fields(subfunction))
+        table = cls._get_field_table()
+        return table.select(table.scale_factors, subfunction)
+
+    @classmethod
+    @cache
+    def _get_scaled_parameters(
+        cls, subfunction: int = NO_SUBFUNCTION
+    ) -> tuple[tuple[int, float, bool], ...]:
+        """
+        Returns
+        -------
+        tuple[tuple[int, float, bool], ...]
+            Position and scaling factor of the parameters that actually need
+            to be rescaled, i.e. whose scaling factor is not 1, and whether
+            their format is an integer one, the scaled value being rounded then
+        """
+        table = cls._get_field_table()
+        return tuple(
+            (i, factor, fmt[-1:] in _INTEGER_FORMATS)
+            for i, (factor, fmt) in enumerate(
+                zip(
+                    cls.get_parameter_scaling_factors(subfunction),
+                    table.select(table.fmts, subfunction),
+                )
+            )
+            if factor != 1
+        )
+
+    @classmethod
+    @cache
+    def _attrgetter(
+        cls, subfunction: int = NO_SUBFUNCTION
+    ) -> Callable[[ServiceData], tuple[UdsPayloadTypes, ...]]:
+        """
+        Returns
+        -------
+        Callable[[ServiceData], tuple[UdsPayloadTypes, ...]]
+            A getter returning the values of the parameters of the given subfunction,
+            as a tuple, in a single C-level call.
+        """
+        names = cls.get_parameter_names(subfunction)
+        if names.__len__() > 1:
+            return attrgetter(*names)
+        if names:
+            # attrgetter returns the bare value when given a single name
+            (name,) = names
+            return lambda data: (getattr(data, name),)
+        return lambda data: ()
 
     def get_parameter_values(
         self, subfunction: int = NO_SUBFUNCTION, scale: bool = False
-    ) -> Iterator[UdsPayloadTypes]:
+    ) -> tuple[UdsPayloadTypes, ...]:
         """
-        Yields
-        ------
-        str
-            Name of the parameters that should be included for the passed subfunction
-
+        Parameters
+        ----------
         scale: bool
             If enabled, rescales the parameters that have defined a resolution.
             You should typically enable this flag if when extracting this data to
             encode it in binary.
+            As when packing, rescaled values are rounded for integer formats.
+
+        Returns
+        -------
+        tuple[UdsPayloadTypes, ...]
+            Values of the parameters that should be included for the passed subfunction
         """
-        base_map = map(self.__getattribute__, self._iter_parameter_names(subfunction))
+        values = self._attrgetter(subfunction)(self)
         if not scale:
-            return base_map
-        # otherwise applying resolutions
-        return (
-            val * factor
-            for val, factor in zip(
-                base_map, self.get_parameter_scaling_factors(subfunction)
-            )
-        )
+            return values
+        scaled_parameters = self._get_scaled_parameters(subfunction)
+        if not scaled_parameters:
+            return values
+        # otherwise applying resolutions, to the parameters that define one
+        scaled_values = list(values)
+        for i, factor, integer in scaled_parameters:
+            # only numeric parameters define a resolution
+            scaled = cast(float, scaled_values[i]) * factor
+            scaled_values[i] = round(scaled) if integer else scaled
+        return tuple(scaled_values)
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, ServiceData):
+        if type(other) is not type(self):
             return NotImplemented
-        return all(
-            (
-                kv_1 == kv_2
-                for kv_1, kv_2 in zip(
-                    self.get_parameter_items(), other.get_parameter_items()
-                )
-            )
-        )
+        subfunction = self.subfunction
+        if subfunction != other.subfunction:
+            return False
+        # parameter values are compared as tuples, in a single C-level comparison
+        getter = self._attrgetter(subfunction)
+        return getter(self) == getter(other)
 
     def get_parameter_items(
         self, subfunction: int = NO_SUBFUNCTION
-    ) -> Iterator[tuple[str, UdsPayloadTypes]]:
+    ) -> tuple[tuple[str, UdsPayloadTypes], ...]:
         """
-        Yields
-        ------
-        str
-            Name of the parameters that should be included for the passed subfunction
+        Returns
+        -------
+        tuple[tuple[str, UdsPayloadTypes], ...]
+            Name and scaled value of the parameters that should be included
+            for the passed subfunction
         """
-        return zip(
-            self.get_parameter_names(subfunction),
-            self.get_parameter_values(subfunction, scale=True),
-        )
-
-    @classmethod
-    def _get_fmt_size_pairs(cls) -> tuple[tuple[str, int], ...]:
         return tuple(
-            (fmt, struct.calcsize(fmt.replace("{}", "")))
-            for fmt in cls._iter_payload_fmt()
+            zip(
+                self.get_parameter_names(subfunction),
+                self.get_parameter_values(subfunction, scale=True),
+            )
         )
 
     @classmethod
@@ -378,108 +984,139 @@ class ServiceData:
             Note that it is extracted independently from the payload,
             thus has to be treated separately.
         """
-        parameter_names = cls.get_parameter_names(subfunction)
-        if not parameter_names:
-            if data:
-                raise ValueError(
-                    f"Binary data got passed to {cls.__name__} despite expecting no parameter "
-                    f"expected by subfunction {subfunction}. "
-                    "Consider checking the subfunction ID. \nData:"
-                    f"{data}"
-                )
-            return cls()
-
-        if not data:
-            raise ValueError(
-                f"{cls.__name__} expects parameters {parameter_names} yet no data was passed"
+        try:
+            unpack_impl = cls._unpack_impl[subfunction]
+        except KeyError:
+            unpack_impl = cls._unpack_impl[subfunction] = cls._compiled_unpack(
+                subfunction
             )
-
-        format_strings = cls._iter_payload_fmt(subfunction)
-        if format_strings.__len__() == 1:
-            (fmt,) = format_strings
-            args = struct.unpack(fmt, data)
-
-            resolutions = cls.get_parameter_resolutions(subfunction)
-            kwargs = {
-                k: v * res for k, v, res in zip(parameter_names, args, resolutions)
-            }
-            return cls(subfunction=subfunction, **kwargs)
-
-        start_index = 0
-        end_index = 0
-        args = []
-        for fmt, size in cls._get_fmt_size_pairs():
-            if args:
-                next_length = args.pop()
-                end_index += next_length
-                fmt = fmt.format(next_length)
-            end_index += size
-            args.extend(struct.unpack(fmt, data[start_index:end_index]))
-            start_index = end_index
-
-        resolutions = cls.get_parameter_resolutions(subfunction)
-        kwargs = {k: v * res for k, v, res in zip(parameter_names, args, resolutions)}
-        return cls(subfunction=subfunction, **kwargs)
+        return cast(Self, unpack_impl(data))
 
     @classmethod
     @cache
     def has_variadic_fields(cls, subfunction: int = NO_SUBFUNCTION) -> bool:
-        return any(
-            (f.has_variable_length for f in cls._iter_parameter_fields(subfunction))
-        )
+        return bool(cls._get_field_table().get_variadic_indexes(subfunction))
 
     @classmethod
     @cache
     def get_variadic_fields_indexes(
         cls, subfunction: int = NO_SUBFUNCTION
     ) -> tuple[int, ...]:
-        return tuple(
-            i
-            for i, f in enumerate(cls._iter_parameter_fields(subfunction))
-            if f.has_variable_length
-        )
+        return cls._get_field_table().get_variadic_indexes(subfunction)
 
     def pack(self) -> bytes:
         """
         Converts this object to bytes
         """
         subfunction = self.subfunction
-        format_strings: tuple[str, ...] = self._iter_payload_fmt(subfunction)
-
-        if not format_strings:
-            return b""
-
-        subfunction_params = self.get_parameter_names(self.subfunction)
-        # generator accessing the values of arguments in this object
-        value_getter = map(self.__getattribute__, subfunction_params)
-        # another comprehension applying the scaling factors to the values
-        args: Iterable[UdsPayloadTypes] = (
-            val * scale
-            for val, scale in zip(
-                value_getter, self.get_parameter_scaling_factors(self.subfunction)
+        try:
+            pack_impl = self._pack_impl[subfunction]
+        except KeyError:
+            pack_impl = self._pack_impl[subfunction] = self._compiled_pack(subfunction)
+        return pack_impl(self)
+
+    def pack_into(self, buffer: bytearray | memoryview, offset: int = 0) -> int:
+        """
+        Writes the binary representation of this object into a pre-allocated buffer,
+        avoiding the allocation of a new bytes object.
+
+        Parameters
+        ----------
+        buffer: bytearray | memoryview
+            A writable buffer, large enough to receive the payload.
+            See `packed_size`
+
+        offset: int
+            Position in the buffer at which the payload should be written
+
+        Returns
+        -------
+        int
+            The number of bytes written
+        """
+        subfunction = self.subfunction
+        try:
+            pack_into_impl = self._pack_into_impl[subfunction]
+        except KeyError:
+            pack_into_impl = self._pack_into_impl[subfunction] = (
+                self._compiled_pack_into(subfunction)
             )
+        return pack_into_impl(self, buffer, offset)
+
+    def packed_size(self) -> int:
+        """
+        Returns
+        -------
+        int
+            The size of the binary representation of this object
+        """
+        subfunction = self.subfunction
+        return self._get_static_size(subfunction) + sum(
+            [
+                len(getattr(self, name))
+                for name in self.get_variadic_parameter_names(subfunction)
+            ]
         )
-        # In case of only static-lengths, we can use the struct.pack function directly
-        if format_strings.__len__() == 1:
-            return struct.pack(format_strings[0], *args)
 
-        # Otherwise, we have to inject the required length one-by-one
+    @classmethod
+    def pack_many(cls, instances: Iterable[Self]) -> bytes:
+        """
+        Packs a series of objects back-to-back into a single payload.
 
-        arg_list = list(args)
-        # Getting the positions of length parameters within the packed format (cached)
-        length_indexes = self.get_variadic_fields_indexes(subfunction)
+        Parameters
+        ----------
+        instances: Iterable[Self]
+            The objects to pack, in order.
+            They should all be instances of this exact class, for the payload
+            to be decoded by `unpack_many`
+        """
+        payloads = []
+        for data in instances:
+            if type(data) is not cls:
+                raise ValueError(
+                    f"{cls.__name__}.pack_many got a {type(data).__name__} instance"
+                )
+            payloads.append(data.pack())
+        return b"".join(payloads)
 
-        # Computing these lengths
-        lengths = tuple(map(len, (arg_list[i] for i in length_indexes)))
-        # inserting the lengths in the argument list
-        for length, position in zip(lengths, length_indexes):
-            arg_list.insert(position, length)
+    @classmethod
+    def unpack_many(
+        cls, data: bytes, subfunction: int = NO_SUBFUNCTION
+    ) -> list[Self]:
+        """
+        Builds a series of objects from back-to-back payloads,
+        e.g. as produced by `pack_many`.
+        Only applies to payloads of statically known size.
 
-        # Injecting the lenghts into the struct format string
-        fmt = self.get_payload_fmt().format(*lengths)
+        Parameters
+        ----------
+        data: bytes
+            The concatenated payloads
 
-        # Now can can pack
-        return struct.pack(fmt, *arg_list)
+        subfunction: int
+            ID of the subfunction shared by all the payloads
+        """
+        if cls.has_variadic_fields(subfunction):
+            raise ValueError(
+                f"{cls.__name__} has variadic fields for subfunction {subfunction}, "
+                "payloads cannot be split without decoding them"
+            )
+        size = cls.get_struct(subfunction).size
+        if not size:
+            raise ValueError(
+                f"{cls.__name__} expects no parameter for subfunction {subfunction}"
+            )
+        if len(data) % size:
+            raise TranscodeError(
+                f"unpack_many requires a buffer of a multiple of {size} bytes"
+            )
+        # records are decoded by a single iterator rather than one unpack per slice
+        return list(
+            starmap(
+                cls._compiled_build(subfunction),
+                cls.get_struct(subfunction).iter_unpack(data),
+            )
+        )
 
 
 class BaseResponseData:
@@ -502,20 +1139,40 @@ class BaseResponseData:
 
 
 class BaseSubfunction:
+    @classmethod
+    @cache
+    def _get_names(
+        cls,
+    ) -> tuple[dict[int, str], tuple[tuple[int, int, str], ...]]:
+        """
+        Returns
+        -------
+        tuple[dict[int, str], tuple[tuple[int, int, str], ...]]
+            The subfunction names by ID, and the (first ID, last ID, name) triplets
+            of the subfunctions declared as ranges of IDs.
+            When several names share an ID, the first in alphabetical order is kept.
+        """
+        names: dict[int, str] = {}
+        ranges = []
+        for name, value in inspect.getmembers(cls, lambda a: not inspect.isroutine(a)):
+            if name.startswith("__") and name.endswith("__"):
+                continue
+            if isinstance(value, int):
+                names.setdefault(value, name)
+            elif isinstance(value, tuple):
+                ranges.append((value[0], value[1], name))
+        return names, tuple(ranges)
+
     @classmethod
     def get_name(cls, subfn_id: int) -> str:
-        attributes = inspect.getmembers(cls, lambda a: not (inspect.isroutine(a)))
-        subfn_list = [
-            a for a in attributes if not (a[0].startswith("__") and a[0].endswith("__"))
-        ]
-
-        for subfn in subfn_list:
-            if isinstance(subfn[1], int):
-                if subfn[1] == subfn_id:  # [1] is value
-                    return subfn[0]  # [0] is property name
-            elif isinstance(subfn[1], tuple):
-                if subfn_id >= subfn[1][0] or subfn_id <= subfn[1][1]:
-                    return subfn[0]
+        names, ranges = cls._get_names()
+        try:
+            return names[subfn_id]
+        except KeyError:
+            pass
+        for first, last, name in ranges:
+            if first <= subfn_id <= last:
+                return name
         name = (
             cls.__name__ if not hasattr(cls, "__pretty_name__") else cls.__pretty_name__
         )
@@ -527,29 +1184,56 @@ class EmptyServiceData(ServiceData):
     Default class to use for Request/Response that do no take any parameter
     """
 
+    __slots__ = ()
     payload_fmt: ClassVar[str | None] = None
 
 
 class BaseService(ABC):
-    always_valid_negative_response = [
-        ResponseCode.GeneralReject,
-        ResponseCode.ServiceNotSupported,
-        ResponseCode.ResponseTooLong,
-        ResponseCode.BusyRepeatRequest,
-        ResponseCode.NoResponseFromSubnetComponent,
-        ResponseCode.FailurePreventsExecutionOfRequestedAction,
-        ResponseCode.SecurityAccessDenied,  # ISO-14229:2006 Table A.1:  "Besides the mandatory use of this negative response code as specified in the applicable services within ISO 14229, this negative response code can also be used for any case where security is required and is not yet granted to perform the required service."
-        ResponseCode.AuthenticationRequired,  # ISO-14229:2020 Figure 5 - General server response behaviour
-        ResponseCode.SecureDataTransmissionRequired,  # ISO-14229:2020 Figure 5 - General server response behaviour
-        ResponseCode.SecureDataTransmissionNotAllowed,  # ISO-14229:2020 Figure 5 - General server response behaviour
-        ResponseCode.RequestCorrectlyReceived_ResponsePending,
-        ResponseCode.ServiceNotSupportedInActiveSession,
-        ResponseCode.ResourceTemporarilyNotAvailable,
-    ]
+    # codes are stored as raw ints, the type of the codes parsed from payloads
+    always_valid_negative_response: ClassVar[frozenset[int]] = frozenset(
+        map(
+            int,
+            {
+                ResponseCode.GeneralReject,
+                ResponseCode.ServiceNotSupported,
+                ResponseCode.ResponseTooLong,
+                ResponseCode.BusyRepeatRequest,
+                ResponseCode.NoResponseFromSubnetComponent,
+                ResponseCode.FailurePreventsExecutionOfRequestedAction,
+                ResponseCode.SecurityAccessDenied,  # ISO-14229:2006 Table A.1:  "Besides the mandatory use of this negative response code as specified in the applicable services within ISO 14229, this negative response code can also be used for any case where security is required and is not yet granted to perform the required service."
+                ResponseCode.AuthenticationRequired,  # ISO-14229:2020 Figure 5 - General server response behaviour
+                ResponseCode.SecureDataTransmissionRequired,  # ISO-14229:2020 Figure 5 - General server response behaviour
+                ResponseCode.SecureDataTransmissionNotAllowed,  # ISO-14229:2020 Figure 5 - General server response behaviour
+                ResponseCode.RequestCorrectlyReceived_ResponsePending,
+                ResponseCode.ServiceNotSupportedInActiveSession,
+                ResponseCode.ResourceTemporarilyNotAvailable,
+            },
+        )
+    )
 
     _sid: int
-    _use_subfunction: bool
-    supported_negative_response: list[int]
+    _use_subfunction: bool = True
+    _no_response_data: bool = False
+    # lists declared by subclasses are converted to frozensets of ints on definition
+    supported_negative_response: Collection[int]
+    # union of the supported and always valid codes, computed on definition
+    _accepted_negative_response: ClassVar[frozenset[int]] = always_valid_negative_response
+    # service classes by request ID, in definition order, filled as they are defined.
+    # Lookups return the first one that subclasses the class they are performed on
+    _services_by_sid: ClassVar[dict[int, list[type[BaseService]]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        sid = getattr(cls, "_sid", None)
+        if sid is not None:
+            BaseService._services_by_sid.setdefault(sid, []).append(cls)
+        if "supported_negative_response" in cls.__dict__:
+            cls.supported_negative_response = frozenset(
+                map(int, cls.supported_negative_response)
+            )
+        cls._accepted_negative_response = cls.always_valid_negative_response.union(
+            getattr(cls, "supported_negative_response", ())
+        )
 
     @classmethod
     def get_request_cls(
@@ -603,51 +1287,50 @@ class BaseService(ABC):
         Base internal primitive to interpret a response.
         """
         response_cls = cls.get_response_cls(standard_version)
-        if response.data is None:
+        data = response.data
+        if data is None:
             return response_cls()
-        print("Got data =", response.data)
         if cls.use_subfunction():
             # for services that support subfonctions,
-            subfunction = response.data[0]
-            data = response.data[1:]
-
-        else:
-            subfunction = cls.default_subfonction_id()
-            data = response.data
-
-        return response_cls.unpack(data, subfunction=subfunction)
+            return response_cls.unpack(data[1:], data[0])
+        return response_cls.unpack(data, cls.default_subfonction_id())
 
     @staticmethod
-    def __get_all_subclasses(cls) -> list[type[BaseService]]:
-        import udsoncan.services  # This import is required for __subclasses__ to have a value. Python never import twice the same package.
+    @cache
+    def _get_services_by_sid() -> dict[int, list[type[BaseService]]]:
+        # Importing the standard services is required for them to be registered.
+        # Services are imported lazily by udsoncan.services, so this is done explicitly, once
+        import udsoncan.services as services
+
+        services.import_all()
 
-        # this gets all subclasses and returns a list where the "most original" subclasses are listed in front of the other subclasses
-        # This enables subclasses of any BaseService outside of udsoncan.services to be available, enabling specialization of calls in
+        # Subclasses of any BaseService outside of udsoncan.services are registered as well, enabling specialization of calls in
         # cases where a CAN message is similar to one found in official UDS documentation but has a different service ID
         # This also allows for custom UDS service creation where a nonstandard extension is more easily played ontop of the protocol
-        lst = []
-        lst.extend(cls.__subclasses__())
-        for x in cls.__subclasses__():
-            subclasses = BaseService.__get_all_subclasses(x)
-            if len(subclasses) > 0:
-                lst.extend(subclasses)
-        return lst
+        # As services are imported lazily, such classes may have been defined before the standard
+        # service sharing their ID, which still takes precedence
+        standard_services = {getattr(services, name) for name in services.__all__}
+        registry = BaseService._services_by_sid
+        for registered in registry.values():
+            # stable sort, the other classes keep their definition order
+            registered.sort(key=lambda service: service not in standard_services)
+        return registry
+
+    @classmethod
+    def _find_subclass(cls, sid: int) -> Optional[type[BaseService]]:
+        # only the subclasses of the class the lookup is performed on are candidates
+        for service in cls._get_services_by_sid().get(sid, ()):
+            if service is not cls and issubclass(service, cls):
+                return service
+        return None
 
     @classmethod  # Returns an instance of the service identified by the service ID (Request)
     def from_request_id(cls, given_id: int) -> Optional[type[BaseService]]:
-        classes = BaseService.__get_all_subclasses(cls)
-        for obj in classes:
-            if obj.request_id() == given_id:
-                return obj
-        return None
+        return cls._find_subclass(given_id)
 
     @classmethod  # Returns an instance of the service identified by the service ID (Response)
     def from_response_id(cls, given_id: int) -> Optional[type[BaseService]]:
-        classes = BaseService.__get_all_subclasses(cls)
-        for obj in classes:
-            if obj.response_id() == int(given_id):
-                return obj
-        return None
+        return cls._find_subclass(int(given_id) - 0x40)
 
     @classmethod
     def default_subfonction_id(cls) -> int:
@@ -658,17 +1341,11 @@ class BaseService(ABC):
 
     @classmethod  # Tells if this service includes a subfunction byte
     def use_subfunction(cls) -> bool:
-        if hasattr(cls, "_use_subfunction"):
-            return cls._use_subfunction
-        else:
-            return True
+        return cls._use_subfunction
 
     @classmethod
     def has_response_data(cls) -> bool:
-        if hasattr(cls, "_no_response_data"):
-            return False if cls._no_response_data else True
-        else:
-            return True
+        return not cls._no_response_data
 
     @classmethod  # Returns the service name. Shortcut that works on class and instances
     def get_name(cls) -> str:
@@ -676,26 +1353,18 @@ class BaseService(ABC):
 
     @classmethod  # Tells if the given response code is expected for this service according to UDS standard.
     def is_supported_negative_response(cls, code: int) -> bool:
-        supported = False
-        if code in cls.supported_negative_response:
-            supported = True
-
-        if code in cls.always_valid_negative_response:
-            supported = True
+        if code in cls._accepted_negative_response:
+            return True
 
         # As specified by Annex A, negative response code ranging above 0x7F can be used anytime if the service can return ConditionNotCorrect
         if (
-            code >= 0x80
-            and code < 0xFF
+            0x80 <= code < 0xFF
             and ResponseCode.ConditionsNotCorrect in cls.supported_negative_response
         ):
-            supported = True
+            return True
 
         # ISO-14229:2006 Table A.1 : "This response code shall be supported by each diagnostic service with a subfunction parameter"
-        if (
+        return (
             code == ResponseCode.SubFunctionNotSupportedInActiveSession
             and cls.use_subfunction()
-        ):
-            supported = True
-
-        return supported
+        )
@@ -1,25 +1,50 @@
-from .address_and_length_format_identifier import AddressAndLengthFormatIdentifier
-from .baudrate import Baudrate
+from typing import TYPE_CHECKING
 
-# keep importing
-from .communication_type import CommunicationType
-from .data_format_identifier import DataFormatIdentifier
+from udsoncan._lazy import lazy_module
 
-# import all submodules
-from .dtc import Dtc
-from .dids import (
-    DataIdentifier,
-    check_did_config,
-    fetch_codec_definition_from_config,
-    make_did_codec_from_definition,
-)
-from .did_codec import DidCodec, AsciiCodec
-from .dynamic_did_definition import DynamicDidDefinition
-from .filesize import Filesize
-from .io_controls import IOMasks, IOValues
-from .memory_location import MemoryLocation
-from .routine import Routine
-from .units import Units
+if TYPE_CHECKING:
+    from .address_and_length_format_identifier import AddressAndLengthFormatIdentifier
+    from .baudrate import Baudrate
+    from .communication_type import CommunicationType
+    from .data_format_identifier import DataFormatIdentifier
+    from .dtc import Dtc
+    from .dids import (
+        DataIdentifier,
+        check_did_config,
+        fetch_codec_definition_from_config,
+        make_did_codec_from_definition,
+    )
+    from .did_codec import DidCodec, AsciiCodec
+    from .dynamic_did_definition import DynamicDidDefinition
+    from .filesize import Filesize
+    from .io_controls import IOMasks, IOValues
+    from .memory_location import MemoryLocation
+    from .routine import Routine
+    from .units import Units
+
+# Public names, mapped to the submodule defining them.
+# They are imported on first access (PEP 562), so that importing this package
+# does not pay for the submodules the caller does not use.
+_LAZY_EXPORTS: dict[str, str] = {
+    "AddressAndLengthFormatIdentifier": "address_and_length_format_identifier",
+    "Baudrate": "baudrate",
+    "CommunicationType": "communication_type",
+    "DataFormatIdentifier": "data_format_identifier",
+    "Dtc": "dtc",
+    "DataIdentifier": "dids",
+    "check_did_config": "dids",
+    "fetch_codec_definition_from_config": "dids",
+    "make_did_codec_from_definition": "dids",
+    "DidCodec": "did_codec",
+    "AsciiCodec": "did_codec",
+    "DynamicDidDefinition": "dynamic_did_definition",
+    "Filesize": "filesize",
+    "IOMasks": "io_controls",
+    "IOValues": "io_controls",
+    "MemoryLocation": "memory_location",
+    "Routine": "routine",
+    "Units": "units",
+}
 
 # eppose everything
 __all__ = [
@@ -42,3 +67,6 @@ __all__ = [
     "Routine",
     "Units",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_EXPORTS)
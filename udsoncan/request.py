@@ -150,6 +150,18 @@ class Request:
                     req.data = payload[offset + 1 :]
         return req
 
+    def copy(self) -> "Request":
+        """
+        Creates a shallow copy of this request, without going through the validation
+        performed by the constructor
+
+        :return: A :ref:`Request<Request>` object with the same fields
+        :rtype: :ref:`Request<Request>`
+        """
+        req = object.__new__(self.__class__)
+        req.__dict__.update(self.__dict__)
+        return req
+
     def __repr__(self) -> str:
         suppress_positive_response = (
             "[SuppressPosResponse] " if self.suppress_positive_response else ""
@@ -1,11 +1,11 @@
-from udsoncan.base_service import BaseService, BaseResponseData
+from udsoncan.base_service import BaseService, BaseResponseData, ServiceData
 from udsoncan.response_code import ResponseCode
 import inspect
 import struct
 
 from udsoncan.request import Request
 
-from typing import Type, Optional, Union
+from typing import Generic, Type, TypeVar, Optional, Union
 
 
 class Response:
@@ -75,7 +75,7 @@ class Response:
     data: Optional[bytes]
     suppress_positive_response: bool
     original_payload: Optional[bytes]
-    service_data: Optional[BaseResponseData]
+    service_data: Optional[Union[BaseResponseData, ServiceData]]
     original_request: Optional[Request]
 
     def __init__(
@@ -260,3 +260,17 @@ class Response:
             return len(self.get_payload())
         except:
             return 0
+
+
+ServiceDataT = TypeVar(
+    "ServiceDataT", bound=Optional[Union[BaseResponseData, ServiceData]]
+)
+
+
+class InterpretedResponse(Response, Generic[ServiceDataT]):
+    """
+    A :ref:`Response<Response>` whose ``service_data`` was populated by its service.
+    Services expose it parametrized with their response data type, e.g. ``ECUReset.InterpretedResponse``
+    """
+
+    service_data: ServiceDataT
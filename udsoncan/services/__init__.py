@@ -1,31 +1,68 @@
-from .diagnostic_session_control import DiagnosticSessionControl
-from .ecu_reset import ECUReset
-from .security_access import SecurityAccess
-from .communication_control import CommunicationControl
-from .access_timing_parameter import AccessTimingParameter
-from .secured_data_transmission import SecuredDataTransmission
-from .tester_present import TesterPresent
-from .control_dtc_setting import ControlDTCSetting
-from .response_on_event import ResponseOnEvent
-from .link_control import LinkControl
-from .read_data_by_identifier import ReadDataByIdentifier
-from .write_data_by_identifier import WriteDataByIdentifier
-from .read_memory_by_address import ReadMemoryByAddress
-from .input_output_control_by_identifier import InputOutputControlByIdentifier
-from .routine_control import RoutineControl
-from .read_scaling_data_by_identifier import ReadScalingDataByIdentifier
-from .read_data_by_periodic_identifier import ReadDataByPeriodicIdentifier
-from .write_memory_by_address import WriteMemoryByAddress
-from .dynamically_define_data_identifier import DynamicallyDefineDataIdentifier
-from .clear_diagnostic_information import ClearDiagnosticInformation
-from .read_dtc_information import ReadDTCInformation
-from .request_download import RequestDownload
-from .request_upload import RequestUpload
-from .transfer_data import TransferData
-from .request_transfer_exit import RequestTransferExit
-from .request_file_transfer import RequestFileTransfer
-from .authentication import Authentication
+from typing import TYPE_CHECKING
 
+from udsoncan._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .diagnostic_session_control import DiagnosticSessionControl
+    from .ecu_reset import ECUReset
+    from .security_access import SecurityAccess
+    from .communication_control import CommunicationControl
+    from .access_timing_parameter import AccessTimingParameter
+    from .secured_data_transmission import SecuredDataTransmission
+    from .tester_present import TesterPresent
+    from .control_dtc_setting import ControlDTCSetting
+    from .response_on_event import ResponseOnEvent
+    from .link_control import LinkControl
+    from .read_data_by_identifier import ReadDataByIdentifier
+    from .write_data_by_identifier import WriteDataByIdentifier
+    from .read_memory_by_address import ReadMemoryByAddress
+    from .input_output_control_by_identifier import InputOutputControlByIdentifier
+    from .routine_control import RoutineControl
+    from .read_scaling_data_by_identifier import ReadScalingDataByIdentifier
+    from .read_data_by_periodic_identifier import ReadDataByPeriodicIdentifier
+    from .write_memory_by_address import WriteMemoryByAddress
+    from .dynamically_define_data_identifier import DynamicallyDefineDataIdentifier
+    from .clear_diagnostic_information import ClearDiagnosticInformation
+    from .read_dtc_information import ReadDTCInformation
+    from .request_download import RequestDownload
+    from .request_upload import RequestUpload
+    from .transfer_data import TransferData
+    from .request_transfer_exit import RequestTransferExit
+    from .request_file_transfer import RequestFileTransfer
+    from .authentication import Authentication
+
+# Service classes, mapped to the submodule defining them.
+# Services are imported on first access (PEP 562), so that importing this package
+# does not pay for the services the caller does not use.
+_LAZY_EXPORTS: dict[str, str] = {
+    "DiagnosticSessionControl": "diagnostic_session_control",
+    "ECUReset": "ecu_reset",
+    "SecurityAccess": "security_access",
+    "CommunicationControl": "communication_control",
+    "AccessTimingParameter": "access_timing_parameter",
+    "SecuredDataTransmission": "secured_data_transmission",
+    "TesterPresent": "tester_present",
+    "ControlDTCSetting": "control_dtc_setting",
+    "ResponseOnEvent": "response_on_event",
+    "LinkControl": "link_control",
+    "ReadDataByIdentifier": "read_data_by_identifier",
+    "WriteDataByIdentifier": "write_data_by_identifier",
+    "ReadMemoryByAddress": "read_memory_by_address",
+    "InputOutputControlByIdentifier": "input_output_control_by_identifier",
+    "RoutineControl": "routine_control",
+    "ReadScalingDataByIdentifier": "read_scaling_data_by_identifier",
+    "ReadDataByPeriodicIdentifier": "read_data_by_periodic_identifier",
+    "WriteMemoryByAddress": "write_memory_by_address",
+    "DynamicallyDefineDataIdentifier": "dynamically_define_data_identifier",
+    "ClearDiagnosticInformation": "clear_diagnostic_information",
+    "ReadDTCInformation": "read_dtc_information",
+    "RequestDownload": "request_download",
+    "RequestUpload": "request_upload",
+    "TransferData": "transfer_data",
+    "RequestTransferExit": "request_transfer_exit",
+    "RequestFileTransfer": "request_file_transfer",
+    "Authentication": "authentication",
+}
 
 __all__ = [
     "DiagnosticSessionControl",
@@ -56,3 +93,15 @@ __all__ = [
     "RequestFileTransfer",
     "Authentication",
 ]
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_EXPORTS)
+
+
+def import_all() -> None:
+    """
+    Imports all the standard services, e.g. for them to be registered
+    by their service ID
+    """
+    for name in _LAZY_EXPORTS:
+        __getattr__(name)
@@ -1,5 +1,5 @@
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseSubfunction, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -49,8 +49,7 @@ class AccessTimingParameter(BaseService):
         ResponseCode.RequestOutOfRange,
     ]
 
-    class InterpretedResponse(Response):
-        service_data: "AccessTimingParameter.ResponseData"
+    InterpretedResponse = _InterpretedResponse["AccessTimingParameter.ResponseData"]
 
     @classmethod
     def make_request(
@@ -4,7 +4,7 @@ import struct
 from enum import IntEnum
 from dataclasses import dataclass
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.base_service import (
     BaseService,
     BaseSubfunction,
@@ -47,7 +47,7 @@ class AuthenticationReturnParameter(IntEnum):
     CertificateVerified = 0x13
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestData(ServiceData):
     """
     .. data:: authentication_task_echo
@@ -165,7 +165,7 @@ class RequestData(ServiceData):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseData(ServiceData):
     SupportedSubFunctions: ClassVar[type[IntEnum] | None] = AuthenticationTask
     return_value: AuthenticationReturnParameter = uds_field(
@@ -253,6 +253,8 @@ class Authentication(BaseService):
         ResponseCode.DeAuthenticationFailed,
     ]
 
+    InterpretedResponse = _InterpretedResponse[ResponseData]
+
     @classmethod
     def get_request_cls(
         cls, standard_version: StandardVersion = StandardVersion.latest()
@@ -1,7 +1,7 @@
 import struct
 from udsoncan import latest_standard
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -28,8 +28,7 @@ class ClearDiagnosticInformation(BaseService):
         def __init__(self):
             super().__init__(ClearDiagnosticInformation)
 
-    class InterpretedResponse(Response):
-        service_data: "ClearDiagnosticInformation.ResponseData"
+    InterpretedResponse = _InterpretedResponse["ClearDiagnosticInformation.ResponseData"]
 
     @classmethod
     def make_request(
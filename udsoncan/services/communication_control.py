@@ -1,5 +1,5 @@
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan import CommunicationType
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseSubfunction, BaseResponseData
@@ -48,8 +48,7 @@ class CommunicationControl(BaseService):
             super().__init__(CommunicationControl)
             self.control_type_echo = control_type_echo
 
-    class InterpretedResponse(Response):
-        service_data: "CommunicationControl.ResponseData"
+    InterpretedResponse = _InterpretedResponse["CommunicationControl.ResponseData"]
 
     @classmethod
     def normalize_communication_type(
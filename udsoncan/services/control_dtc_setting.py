@@ -1,5 +1,5 @@
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseSubfunction, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -47,8 +47,7 @@ class ControlDTCSetting(BaseService):
             super().__init__(ControlDTCSetting)
             self.setting_type_echo = setting_type_echo
 
-    class InterpretedResponse(Response):
-        service_data: "ControlDTCSetting.ResponseData"
+    InterpretedResponse = _InterpretedResponse["ControlDTCSetting.ResponseData"]
 
     @classmethod
     def make_request(cls, setting_type: int, data: Optional[bytes] = None) -> Request:
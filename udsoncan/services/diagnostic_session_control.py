@@ -7,13 +7,13 @@ from udsoncan.standards import StandardVersion
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseSubfunction, ServiceData, uds_field
 from udsoncan.response_code import ResponseCode
-import udsoncan.tools as tools
 
 from dataclasses import dataclass
-from typing import Optional, cast, overload, Literal
+from functools import cache
+from typing import ClassVar, Optional, cast, overload, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseDataPost2006(ServiceData):
     """
     Parameters
@@ -29,7 +29,7 @@ class ResponseDataPost2006(ServiceData):
     p2_star_server_max: float = uds_field(100.0, "H", resolution=.01)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseDataPre2006(ServiceData):
     """
     Parameters
@@ -51,7 +51,13 @@ class DiagnosticSessionControl(BaseService):
         ResponseCode.ConditionsNotCorrect,
     ]
 
-    payload_fmt = ">HH"
+    # kept for backward compatibility, derived from the latest response layout
+    payload_fmt = ResponseDataPost2006.get_struct().format
+
+    # response layouts that differ from the latest one, by standard version
+    _response_cls_by_version: ClassVar[dict[StandardVersion, type[ServiceData]]] = {
+        StandardVersion.UDS_2006: ResponseDataPre2006,
+    }
 
     class Session(BaseSubfunction):
         """
@@ -97,9 +103,7 @@ class DiagnosticSessionControl(BaseService):
         type[ServiceData]
             The class to use for the response payload
         """
-        if standard_version == StandardVersion.UDS_2006:
-            return ResponseDataPre2006
-        return ResponseDataPost2006
+        return cls._response_cls_by_version.get(standard_version, ResponseDataPost2006)
 
     @classmethod
     def make_request(cls, session: int) -> Request:
@@ -112,7 +116,24 @@ class DiagnosticSessionControl(BaseService):
         :raises ValueError: If parameters are out of range, missing or wrong type
         """
 
-        tools.validate_int(session, min=0, max=0x7F, name="Session number")
+        # same checks as tools.validate_int, inlined with constant bounds
+        if not isinstance(session, int):
+            raise ValueError("Session number must be a valid integer")
+        if not 0 <= session <= 0x7F:
+            raise ValueError("Session number must be an integer between 0x0 and 0x7F")
+        # requests are mutable, callers get their own copy of the prebuilt request
+        return cls._get_request_template(session).copy()
+
+    @classmethod
+    @cache
+    def _get_request_template(cls, session: int) -> Request:
+        """
+        Returns
+        -------
+        Request
+            A request for the given session, built once and then copied by
+            `make_request`
+        """
         return Request(service=cls, subfunction=session)
 
     @overload
@@ -1,7 +1,7 @@
 import struct
 from udsoncan import DynamicDidDefinition
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseSubfunction, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -39,8 +39,7 @@ class DynamicallyDefineDataIdentifier(BaseService):
             self.subfunction_echo = subfunction_echo
             self.did_echo = did_echo
 
-    class InterpretedResponse(Response):
-        service_data: "DynamicallyDefineDataIdentifier.ResponseData"
+    InterpretedResponse = _InterpretedResponse["DynamicallyDefineDataIdentifier.ResponseData"]
 
     @classmethod
     def make_request(
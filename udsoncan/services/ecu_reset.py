@@ -1,5 +1,5 @@
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseSubfunction, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -51,8 +51,7 @@ class ECUReset(BaseService):
             self.reset_type_echo = reset_type_echo
             self.powerdown_time = powerdown_time
 
-    class InterpretedResponse(Response):
-        service_data: "ECUReset.ResponseData"
+    InterpretedResponse = _InterpretedResponse["ECUReset.ResponseData"]
 
     @classmethod
     def make_request(cls, reset_type: int) -> Request:
@@ -1,7 +1,7 @@
 import struct
 import math
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan import (
     IOMasks,
     IOValues,
@@ -75,8 +75,7 @@ class InputOutputControlByIdentifier(BaseService):
             self.control_param_echo = control_param_echo
             self.decoded_data = decoded_data
 
-    class InterpretedResponse(Response):
-        service_data: "InputOutputControlByIdentifier.ResponseData"
+    InterpretedResponse = _InterpretedResponse["InputOutputControlByIdentifier.ResponseData"]
 
     @classmethod
     def make_request(
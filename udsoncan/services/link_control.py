@@ -1,6 +1,6 @@
 from udsoncan import Baudrate
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseSubfunction, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -44,8 +44,7 @@ class LinkControl(BaseService):
             super().__init__(LinkControl)
             self.control_type_echo = control_type_echo
 
-    class InterpretedResponse(Response):
-        service_data: "LinkControl.ResponseData"
+    InterpretedResponse = _InterpretedResponse["LinkControl.ResponseData"]
 
     @classmethod
     def make_request(
@@ -8,7 +8,7 @@ from udsoncan import (
     DIDConfig,
 )
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -42,8 +42,7 @@ class ReadDataByIdentifier(BaseService):
 
             self.values = values
 
-    class InterpretedResponse(Response):
-        service_data: "ReadDataByIdentifier.ResponseData"
+    InterpretedResponse = _InterpretedResponse["ReadDataByIdentifier.ResponseData"]
 
     @classmethod
     def validate_didlist_input(cls, dids: Union[int, List[int]]) -> List[int]:
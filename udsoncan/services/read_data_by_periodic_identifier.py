@@ -1,5 +1,5 @@
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -19,8 +19,7 @@ class ReadDataByPeriodicIdentifier(BaseService):
         def __init__(self):
             super().__init__(ReadDataByPeriodicIdentifier)
 
-    class InterpretedResponse(Response):
-        service_data: "ReadDataByPeriodicIdentifier.ResponseData"
+    InterpretedResponse = _InterpretedResponse["ReadDataByPeriodicIdentifier.ResponseData"]
 
     @classmethod
     def make_request(cls) -> Request:
@@ -8,7 +8,7 @@ from udsoncan import (
     DIDConfig,
 )
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseSubfunction, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -85,8 +85,7 @@ class ReadDTCInformation(BaseService):
             self.extended_data = extended_data if extended_data is not None else []
             self.memory_selection_echo = memory_selection_echo
 
-    class InterpretedResponse(Response):
-        service_data: "ReadDTCInformation.ResponseData"
+    InterpretedResponse = _InterpretedResponse["ReadDTCInformation.ResponseData"]
 
     class Subfunction(BaseSubfunction):
         __pretty_name__ = "subfunction"
@@ -1,6 +1,6 @@
 from udsoncan import MemoryLocation
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -32,8 +32,7 @@ class ReadMemoryByAddress(BaseService):
             super().__init__(ReadMemoryByAddress)
             self.memory_block = memory_block
 
-    class InterpretedResponse(Response):
-        service_data: "ReadMemoryByAddress.ResponseData"
+    InterpretedResponse = _InterpretedResponse["ReadMemoryByAddress.ResponseData"]
 
     @classmethod
     def make_request(cls, memory_location: MemoryLocation) -> Request:
@@ -1,5 +1,5 @@
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.base_service import BaseService, BaseResponseData
 from udsoncan.response_code import ResponseCode
 from udsoncan.exceptions import *
@@ -19,8 +19,7 @@ class ReadScalingDataByIdentifier(BaseService):
         def __init__(self):
             super().__init__(ReadScalingDataByIdentifier)
 
-    class InterpretedResponse(Response):
-        service_data: "ReadScalingDataByIdentifier.ResponseData"
+    InterpretedResponse = _InterpretedResponse["ReadScalingDataByIdentifier.ResponseData"]
 
     @classmethod
     def make_request(cls) -> Request:
@@ -1,7 +1,7 @@
 import struct
 from udsoncan import DataFormatIdentifier, MemoryLocation
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -34,8 +34,7 @@ class RequestDownload(BaseService):
             super().__init__(RequestDownload)
             self.max_length = max_length
 
-    class InterpretedResponse(Response):
-        service_data: "RequestDownload.ResponseData"
+    InterpretedResponse = _InterpretedResponse["RequestDownload.ResponseData"]
 
     @classmethod
     def normalize_data_format_identifier(
@@ -1,7 +1,7 @@
 import struct
 from udsoncan import DataFormatIdentifier, Filesize
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseSubfunction, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -123,8 +123,7 @@ class RequestFileTransfer(BaseService):
             self.dirinfo_length = dirinfo_length
             self.fileposition = fileposition
 
-    class InterpretedResponse(Response):
-        service_data: "RequestFileTransfer.ResponseData"
+    InterpretedResponse = _InterpretedResponse["RequestFileTransfer.ResponseData"]
 
     @classmethod
     def make_request(
@@ -1,5 +1,5 @@
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.base_service import BaseService, BaseResponseData
 from udsoncan.response_code import ResponseCode
 from udsoncan.exceptions import *
@@ -32,8 +32,7 @@ class RequestTransferExit(BaseService):
             super().__init__(RequestTransferExit)
             self.parameter_records = parameter_records
 
-    class InterpretedResponse(Response):
-        service_data: "RequestTransferExit.ResponseData"
+    InterpretedResponse = _InterpretedResponse["RequestTransferExit.ResponseData"]
 
     @classmethod
     def make_request(cls, data: Optional[bytes] = None) -> Request:
@@ -1,7 +1,7 @@
 import struct
 from udsoncan import DataFormatIdentifier, MemoryLocation
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -34,8 +34,7 @@ class RequestUpload(BaseService):
             super().__init__(RequestUpload)
             self.max_length = max_length
 
-    class InterpretedResponse(Response):
-        service_data: "RequestUpload.ResponseData"
+    InterpretedResponse = _InterpretedResponse["RequestUpload.ResponseData"]
 
     @classmethod
     def normalize_data_format_identifier(
@@ -1,5 +1,5 @@
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.base_service import BaseService, BaseSubfunction, BaseResponseData
 import udsoncan.tools as tools
 from udsoncan.response_code import ResponseCode
@@ -64,8 +64,7 @@ class RoutineControl(BaseService):
             self.routine_id_echo = routine_id_echo
             self.routine_status_record = routine_status_record
 
-    class InterpretedResponse(Response):
-        service_data: "RoutineControl.ResponseData"
+    InterpretedResponse = _InterpretedResponse["RoutineControl.ResponseData"]
 
     @classmethod
     def make_request(
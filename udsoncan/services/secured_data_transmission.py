@@ -1,5 +1,5 @@
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.base_service import BaseService, BaseResponseData
 from udsoncan.response_code import ResponseCode
 from udsoncan.exceptions import *
@@ -41,8 +41,7 @@ class SecuredDataTransmission(BaseService):
         def __init__(self):
             super().__init__(SecuredDataTransmission)
 
-    class InterpretedResponse(Response):
-        service_data: "SecuredDataTransmission.ResponseData"
+    InterpretedResponse = _InterpretedResponse["SecuredDataTransmission.ResponseData"]
 
     @classmethod
     def make_request(cls) -> Request:
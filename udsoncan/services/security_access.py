@@ -1,5 +1,5 @@
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.exceptions import *
 from udsoncan.base_service import BaseService, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -46,8 +46,7 @@ class SecurityAccess(BaseService):
             self.security_level_echo = security_level_echo
             self.seed = seed
 
-    class InterpretedResponse(Response):
-        service_data: "SecurityAccess.ResponseData"
+    InterpretedResponse = _InterpretedResponse["SecurityAccess.ResponseData"]
 
     @classmethod
     def normalize_level(cls, mode: int, level: int) -> int:
@@ -1,7 +1,7 @@
 from udsoncan.base_service import BaseService, BaseResponseData
 from udsoncan.response_code import ResponseCode
 from udsoncan.exceptions import *
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.request import Request
 
 from typing import cast
@@ -28,8 +28,7 @@ class TesterPresent(BaseService):
             super().__init__(TesterPresent)
             self.subfunction_echo = subfunction_echo
 
-    class InterpretedResponse(Response):
-        service_data: "TesterPresent.ResponseData"
+    InterpretedResponse = _InterpretedResponse["TesterPresent.ResponseData"]
 
     @classmethod
     def make_request(cls) -> Request:
@@ -1,6 +1,6 @@
 import struct
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan.base_service import BaseService, BaseResponseData
 from udsoncan.response_code import ResponseCode
 from udsoncan.exceptions import *
@@ -43,8 +43,7 @@ class TransferData(BaseService):
             self.sequence_number_echo = sequence_number_echo
             self.parameter_records = parameter_records
 
-    class InterpretedResponse(Response):
-        service_data: "TransferData.ResponseData"
+    InterpretedResponse = _InterpretedResponse["TransferData.ResponseData"]
 
     @classmethod
     def make_request(
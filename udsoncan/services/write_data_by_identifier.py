@@ -1,6 +1,6 @@
 import struct
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan import (
     DidCodec,
     check_did_config,
@@ -42,8 +42,7 @@ class WriteDataByIdentifier(BaseService):
 
             self.did_echo = did_echo
 
-    class InterpretedResponse(Response):
-        service_data: "WriteDataByIdentifier.ResponseData"
+    InterpretedResponse = _InterpretedResponse["WriteDataByIdentifier.ResponseData"]
 
     @classmethod
     def make_request(cls, did: int, value: Any, didconfig: DIDConfig) -> Request:
@@ -1,5 +1,5 @@
 from udsoncan.request import Request
-from udsoncan.response import Response
+from udsoncan.response import Response, InterpretedResponse as _InterpretedResponse
 from udsoncan import MemoryLocation
 from udsoncan.base_service import BaseService, BaseResponseData
 from udsoncan.response_code import ResponseCode
@@ -39,8 +39,7 @@ class WriteMemoryByAddress(BaseService):
             self.alfid_echo = alfid_echo
             self.memory_location_echo = memory_location_echo
 
-    class InterpretedResponse(Response):
-        service_data: "WriteMemoryByAddress.ResponseData"
+    InterpretedResponse = _InterpretedResponse["WriteMemoryByAddress.ResponseData"]
 
     @classmethod
     def make_request(cls, memory_location: MemoryLocation, data: bytes) -> Request: